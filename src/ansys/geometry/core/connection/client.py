@@ -28,7 +28,7 @@ import time
 from ansys.api.dbu.v0.admin_pb2 import BackendType as GRPCBackendType
 from ansys.api.dbu.v0.admin_pb2_grpc import AdminStub
 from beartype import beartype as check_input_types
-from beartype.typing import Optional, Union
+from beartype.typing import Callable, Optional, Union
 from google.protobuf.empty_pb2 import Empty
 import grpc
 from grpc._channel import _InactiveRpcError
@@ -39,6 +39,7 @@ from ansys.geometry.core.connection.backend import BackendType
 from ansys.geometry.core.connection.defaults import DEFAULT_HOST, DEFAULT_PORT, MAX_MESSAGE_LENGTH
 from ansys.geometry.core.connection.docker_instance import LocalDockerInstance
 from ansys.geometry.core.connection.product_instance import ProductInstance
+from ansys.geometry.core.errors import GeometryExitedError, protect_grpc
 from ansys.geometry.core.logger import LOG, PyGeometryCustomAdapter
 from ansys.geometry.core.typing import Real
 
@@ -137,6 +138,9 @@ class GrpcClient:
     ):
         """Initialize the ``GrpcClient`` object."""
         self._closed = False
+        self._pending_requests = []
+        self._failed_requests = []
+        self._stubs = {}
         self._remote_instance = remote_instance
         self._docker_instance = docker_instance
         self._product_instance = product_instance
@@ -284,7 +288,13 @@ class GrpcClient:
         `PyPIM <https://github.com/ansys/pypim>`_, this instance is
         deleted. Furthermore, if a local Docker instance
         of the Geometry service was started, it is stopped.
+        Requests that are still pending are waited for before closing the channel.
         """
+        try:
+            self.flush()
+        except GeometryExitedError as err:
+            self.log.warning(f"Pending requests could not be completed: {err}")
+
         if self._remote_instance:
             self._remote_instance.delete()  # pragma: no cover
         elif self._docker_instance:
@@ -300,6 +310,80 @@ class GrpcClient:
         self._closed = True
         self._channel.close()
 
+    def _get_stub(self, stub_class: type):
+        """Get the stub of a given class for the client's channel.
+
+        Stubs are created on first use and shared afterwards, which avoids
+        instantiating one per object (such as per face or edge).
+
+        Parameters
+        ----------
+        stub_class : type
+            Class of the gRPC stub, for example ``EdgesStub``.
+        """
+        stub = self._stubs.get(stub_class)
+        if stub is None:
+            stub = self._stubs[stub_class] = stub_class(self._channel)
+        return stub
+
+    def _add_pending_request(
+        self, future: grpc.Future, on_error: Optional[Callable[[], None]] = None
+    ) -> None:
+        """Track a request sent to the Geometry service without waiting for its response.
+
+        Requests that have already completed are checked and dropped, so only the
+        requests still in flight are kept.
+
+        Parameters
+        ----------
+        future : grpc.Future
+            Future returned by the ``future()`` call of a stub method.
+        on_error : Callable[[], None], default: None
+            Callback reverting any client-side state if the request fails.
+        """
+        still_pending = []
+        for request in self._pending_requests:
+            if request[0].done():
+                self._check_request(*request)
+            else:
+                still_pending.append(request)
+        still_pending.append((future, on_error))
+        self._pending_requests = still_pending
+
+    def _check_request(
+        self, future: grpc.Future, on_error: Optional[Callable[[], None]]
+    ) -> None:
+        """Wait for a pending request and record its error, if any."""
+        try:
+            future.result()
+        except Exception as err:
+            if on_error is not None:
+                on_error()
+            self._failed_requests.append(err)
+
+    @protect_grpc
+    def flush(self) -> None:
+        """Wait for all pending requests to be processed by the Geometry service.
+
+        Notes
+        -----
+        Some requests, such as material and mid-surface assignments, are sent to
+        the Geometry service without waiting for their response. Errors raised by
+        these requests surface when this method is called: every pending request
+        is waited for, additional errors are logged and the first one is raised.
+        This method is also called before closing the client and before saving,
+        downloading, or copying bodies of a design.
+        """
+        pending, self._pending_requests = self._pending_requests, []
+        for request in pending:
+            self._check_request(*request)
+
+        failed, self._failed_requests = self._failed_requests, []
+        if failed:
+            for err in failed[1:]:
+                self.log.error(f"Pending request failed: {err}")
+            raise failed[0]
+
     def target(self) -> str:
         """Get the target of the channel."""
         if self._closed:
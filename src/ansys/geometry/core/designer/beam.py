@@ -21,16 +21,30 @@
 # SOFTWARE.
 """Provides for creating and managing a beam."""
 
-from beartype.typing import TYPE_CHECKING, Union
+import sys
 
+from beartype.typing import TYPE_CHECKING, List, Tuple, Union
+import numpy as np
+
+from ansys.geometry.core.math.matrix import Matrix44
 from ansys.geometry.core.math.point import Point3D
 from ansys.geometry.core.math.vector import UnitVector3D
-from ansys.geometry.core.misc.checks import check_type
 from ansys.geometry.core.misc.measurements import Distance
 
 if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.designer.component import Component
 
+_MAX_INTERNED_LENGTH = 128
+"""Maximum length of the IDs and names interned by the beam classes."""
+
+
+def _intern(value: str) -> str:
+    """Intern a short string so that repeated IDs and names share one object.
+
+    Long strings are returned untouched since they are unlikely to be repeated.
+    """
+    return sys.intern(value) if len(value) < _MAX_INTERNED_LENGTH else value
+
 
 class BeamProfile:
     """Represents a single beam profile organized within the design assembly.
@@ -51,10 +65,12 @@ class BeamProfile:
     object. You should call the specific ``Design`` API for the ``BeamProfile`` desired.
     """
 
+    __slots__ = ("_id", "_name")
+
     def __init__(self, id: str, name: str):
         """Initialize ``BeamProfile`` class."""
-        self._id = id
-        self._name = name
+        self._id = _intern(id)
+        self._name = _intern(name)
 
     @property
     def id(self) -> str:
@@ -94,6 +110,8 @@ class BeamCircularProfile(BeamProfile):
     object. You should call the specific ``Design`` API for the ``BeamProfile`` desired.
     """
 
+    __slots__ = ("_radius", "_center", "_dir_x", "_dir_y")
+
     def __init__(
         self,
         id: str,
@@ -132,17 +150,34 @@ class BeamCircularProfile(BeamProfile):
         """Y-axis direction of the circular beam profile."""
         return self._dir_y
 
-    def __repr__(self) -> str:
-        """Represent the ``BeamCircularProfile`` as a string."""
-        lines = [f"ansys.geometry.core.designer.BeamCircularProfile {hex(id(self))}"]
-        lines.append(f"  Name                 : {self.name}")
-        lines.append(f"  Radius               : {str(self.radius.value)}")
-        lines.append(
-            f"  Center               : [{','.join([str(x) for x in self.center])}] in meters"
+    __repr__ = object.__repr__
+
+    def describe(self) -> str:
+        """Describe the ``BeamCircularProfile`` in a human-readable format.
+
+        Returns
+        -------
+        str
+            Multi-line summary of the circular beam profile.
+        """
+        # Built on every call: the radius and center are mutable objects
+        center = ",".join(map(str, self._center.tolist()))
+        return (
+            f"ansys.geometry.core.designer.BeamCircularProfile {id(self):#x}\n"
+            f"  Name                 : {self._name}\n"
+            f"  Radius               : {self._radius.value}\n"
+            f"  Center               : [{center}] in meters\n"
+            f"  Direction x          : [{','.join(map(str, self._dir_x.tolist()))}]\n"
+            f"  Direction y          : [{','.join(map(str, self._dir_y.tolist()))}]"
         )
-        lines.append(f"  Direction x          : [{','.join([str(x) for x in self.direction_x])}]")
-        lines.append(f"  Direction y          : [{','.join([str(x) for x in self.direction_y])}]")
-        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        """Represent the ``BeamCircularProfile`` as a string."""
+        return self.describe()
+
+
+_BEAM_ARG_TYPES = (("id", str), ("start", Point3D), ("end", Point3D), ("profile", BeamProfile))
+"""Expected types of the ``Beam`` constructor arguments, in positional order."""
 
 
 class Beam:
@@ -166,6 +201,15 @@ class Beam:
         Parent component to nest the new beam under within the design assembly.
     """
 
+    __slots__ = (
+        "_id",
+        "_start",
+        "_end",
+        "_profile",
+        "_parent_component",
+        "_is_alive",
+    )
+
     def __init__(
         self,
         id: str,
@@ -175,15 +219,23 @@ class Beam:
         parent_component: "Component",
     ):
         """Initialize ``Beam`` class."""
-        from ansys.geometry.core.designer.component import Component
-
-        check_type(id, str)
-        check_type(start, Point3D)
-        check_type(end, Point3D)
-        check_type(profile, BeamProfile)
-        check_type(parent_component, Component)
-
-        self._id = id
+        # Validation is skipped when running Python with the ``-O`` flag
+        if __debug__:
+            for value, (name, expected_type) in zip((id, start, end, profile), _BEAM_ARG_TYPES):
+                if not isinstance(value, expected_type):
+                    raise TypeError(
+                        f"Provided type {type(value)} for '{name}' is invalid. "
+                        f"Type {expected_type} is expected."
+                    )
+            from ansys.geometry.core.designer.component import Component
+
+            if not isinstance(parent_component, Component):
+                raise TypeError(
+                    f"Provided type {type(parent_component)} for 'parent_component' is invalid. "
+                    f"Type {Component} is expected."
+                )
+
+        self._id = _intern(id)
         self._start = start
         self._end = end
         self._profile = profile
@@ -220,14 +272,144 @@ class Beam:
         """Flag indicating whether the beam is still alive on the server."""
         return self._is_alive
 
-    def __repr__(self) -> str:
-        """Represent the beam as a string."""
-        lines = [f"ansys.geometry.core.designer.Beam {hex(id(self))}"]
-        lines.append(f"  Exists               : {self.is_alive}")
-        lines.append(
-            f"  Start                : [{','.join([str(x) for x in self.start])}] in meters"
+    __repr__ = object.__repr__
+
+    def describe(self) -> str:
+        """Describe the beam in a human-readable format.
+
+        Returns
+        -------
+        str
+            Multi-line summary of the beam, including its profile.
+        """
+        start, end = (",".join(map(str, point.tolist())) for point in (self._start, self._end))
+        return (
+            f"ansys.geometry.core.designer.Beam {id(self):#x}\n"
+            f"  Exists               : {self._is_alive}\n"
+            f"  Start                : [{start}] in meters\n"
+            f"  End                  : [{end}] in meters\n"
+            f"  Parent component     : {self._parent_component.name}\n"
+            "\n\n"
+            "  Beam Profile info\n"
+            "  -----------------\n"
+            f"{self._profile}"
         )
-        lines.append(f"  End                  : [{','.join([str(x) for x in self.end])}] in meters")
-        lines.append(f"  Parent component     : {self.parent_component.name}")
-        lines.extend(["\n", "  Beam Profile info", "  -----------------", str(self.profile)])
-        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        """Represent the beam as a string."""
+        return self.describe()
+
+
+class BeamArray:
+    """Provides a structure-of-arrays container for bulk operations on beams.
+
+    The start and end points of the beams are stored in one contiguous
+    ``(N, 2, 3)`` array, expressed in the ``Point3D`` base units, so that
+    geometric queries over many beams run as single NumPy operations.
+
+    Parameters
+    ----------
+    beams : List[Beam]
+        Beams to store in the container.
+
+    Notes
+    -----
+    The container is a read-only snapshot. Beams created or deleted after
+    its construction are not reflected.
+    """
+
+    __slots__ = ("_beams", "_ids", "_endpoints", "_profiles")
+
+    def __init__(self, beams: List[Beam]):
+        """Initialize ``BeamArray`` class."""
+        self._beams = list(beams)
+        self._ids = [beam._id for beam in self._beams]
+        self._endpoints = np.array(
+            [(beam._start, beam._end) for beam in self._beams], dtype=float
+        ).reshape(-1, 2, 3)
+        self._profiles = np.empty(len(self._beams), dtype=object)
+        self._profiles[:] = [beam._profile for beam in self._beams]
+
+    @classmethod
+    def from_beams(cls, beams: List[Beam]) -> "BeamArray":
+        """Create a ``BeamArray`` from a list of beams.
+
+        Parameters
+        ----------
+        beams : List[Beam]
+            Beams to store in the container.
+
+        Returns
+        -------
+        BeamArray
+            Container holding the beams.
+        """
+        return cls(beams)
+
+    @property
+    def ids(self) -> List[str]:
+        """Service-defined IDs of the beams."""
+        return self._ids
+
+    @property
+    def starts(self) -> np.ndarray:
+        """Start points of the beams as an ``(N, 3)`` array in base units."""
+        return self._endpoints[:, 0]
+
+    @property
+    def ends(self) -> np.ndarray:
+        """End points of the beams as an ``(N, 3)`` array in base units."""
+        return self._endpoints[:, 1]
+
+    @property
+    def profiles(self) -> np.ndarray:
+        """Beam profiles of the beams as an object array."""
+        return self._profiles
+
+    def lengths(self) -> np.ndarray:
+        """Compute the length of each beam.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            Lengths of the beams in base units.
+        """
+        return np.linalg.norm(np.diff(self._endpoints, axis=1)[:, 0], axis=1)
+
+    def midpoints(self) -> np.ndarray:
+        """Compute the midpoint of each beam.
+
+        Returns
+        -------
+        ~numpy.ndarray
+            ``(N, 3)`` array with the midpoints of the beams in base units.
+        """
+        return self._endpoints.mean(axis=1)
+
+    def transform(self, matrix: Matrix44) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply a transformation matrix to the start and end points of the beams.
+
+        The beams themselves are not modified, neither locally nor on the server.
+
+        Parameters
+        ----------
+        matrix : Matrix44
+            4x4 transformation matrix to apply.
+
+        Returns
+        -------
+        Tuple[~numpy.ndarray, ~numpy.ndarray]
+            Transformed start and end points as ``(N, 3)`` arrays in base units.
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        rotation, translation = matrix[:3, :3], matrix[:3, 3]
+        transformed = self._endpoints @ rotation.T + translation
+        return transformed[:, 0], transformed[:, 1]
+
+    def __len__(self) -> int:
+        """Get the number of beams in the container."""
+        return len(self._beams)
+
+    def __getitem__(self, index: int) -> Beam:
+        """Get the beam at the given index."""
+        return self._beams[index]
@@ -22,7 +22,7 @@
 """Provides for managing a body."""
 from abc import ABC, abstractmethod
 from enum import Enum, unique
-from functools import wraps
+from functools import lru_cache, wraps
 
 from ansys.api.dbu.v0.dbumodels_pb2 import EntityIdentifier
 from ansys.api.geometry.v0.bodies_pb2 import (
@@ -44,16 +44,26 @@ from ansys.api.geometry.v0.commands_pb2 import (
     ProjectCurvesRequest,
 )
 from ansys.api.geometry.v0.commands_pb2_grpc import CommandsStub
+from ansys.api.geometry.v0.models_pb2 import Direction as GRPCDirection
 from beartype import beartype as check_input_types
-from beartype.typing import TYPE_CHECKING, Iterable, List, Optional, Tuple, Union
-from pint import Quantity
+from beartype.typing import (
+    TYPE_CHECKING,
+    Callable,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import numpy as np
+from pint import Quantity, Unit
 
 from ansys.geometry.core.connection.client import GrpcClient
 from ansys.geometry.core.connection.conversions import (
     frame_to_grpc_frame,
     plane_to_grpc_plane,
     point3d_to_grpc_point,
-    sketch_shapes_to_grpc_geometries,
     tess_to_pd,
     unit_vector_to_grpc_direction,
 )
@@ -82,6 +92,21 @@ if TYPE_CHECKING:  # pragma: no cover
     from ansys.geometry.core.designer.component import Component
 
 
+@lru_cache(maxsize=128)
+def _grpc_direction(x: Real, y: Real, z: Real) -> GRPCDirection:
+    """Get the gRPC direction message for a unit vector's components.
+
+    The returned message is shared between calls and must not be modified.
+    """
+    return unit_vector_to_grpc_direction(UnitVector3D([x, y, z]))
+
+
+@lru_cache(maxsize=128)
+def _to_server_length(magnitude: Real, unit: Unit, server_unit: Unit) -> Real:
+    """Convert a length magnitude expressed in ``unit`` to the server length unit."""
+    return Quantity(magnitude, unit).m_as(server_unit)
+
+
 @unique
 class MidSurfaceOffsetType(Enum):
     """Provides values for mid-surface offsets supported."""
@@ -111,6 +136,8 @@ class IBody(ABC):
     class. All child classes must implement all abstract methods.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def id(self) -> str:
         """Get the ID of the body as a string."""
@@ -141,6 +168,19 @@ class IBody(ABC):
         """
         return
 
+    @abstractmethod
+    def refresh(self) -> None:
+        """Clear the faces, edges, and tessellation cached for the body.
+
+        Notes
+        -----
+        The faces, edges, and tessellation of a body are cached after they are first
+        retrieved from the server, and the cache is cleared by the body methods that
+        modify it. Call this method when the body has been modified by other means, so
+        that the next access retrieves this information again from the server.
+        """
+        return
+
     @abstractmethod
     def is_alive(self) -> bool:
         """Check if the body is still alive and has not been deleted."""
@@ -189,6 +229,12 @@ class IBody(ABC):
         ----------
         material : Material
             Source material data.
+
+        Notes
+        -----
+        The request is sent without waiting for its response. Call
+        :meth:`GrpcClient.flush() <ansys.geometry.core.connection.client.GrpcClient.flush>`
+        to wait for it and raise any error it produced.
         """
         return
 
@@ -204,6 +250,10 @@ class IBody(ABC):
         Notes
         -----
         Only surface bodies are eligible for mid-surface thickness assignment.
+
+        The request is sent without waiting for its response. Call
+        :meth:`GrpcClient.flush() <ansys.geometry.core.connection.client.GrpcClient.flush>`
+        to wait for it and raise any error it produced.
         """
         return
 
@@ -219,6 +269,10 @@ class IBody(ABC):
         Notes
         -----
         Only surface bodies are eligible for mid-surface offset assignment.
+
+        The request is sent without waiting for its response. Call
+        :meth:`GrpcClient.flush() <ansys.geometry.core.connection.client.GrpcClient.flush>`
+        to wait for it and raise any error it produced.
         """
         return
 
@@ -632,6 +686,24 @@ class MasterBody(IBody):
         master body is a 3D object (with volume).
     """
 
+    __slots__ = (
+        "_id",
+        "_name",
+        "_grpc_client",
+        "_is_surface",
+        "_surface_thickness",
+        "_surface_offset",
+        "_is_alive",
+        "_bodies_stub",
+        "_commands_stub",
+        "_grpc_id_msg",
+        "_tessellation",
+        "_tessellation_pdata",
+        "_tessellation_merged",
+        "_topology_cache",
+    )
+
+    @check_input_types
     def __init__(
         self,
         id: str,
@@ -640,11 +712,6 @@ class MasterBody(IBody):
         is_surface: bool = False,
     ):
         """Initialize the ``MasterBody`` class."""
-        check_type(id, str)
-        check_type(name, str)
-        check_type(grpc_client, GrpcClient)
-        check_type(is_surface, bool)
-
         self._id = id
         self._name = name
         self._grpc_client = grpc_client
@@ -652,12 +719,16 @@ class MasterBody(IBody):
         self._surface_thickness = None
         self._surface_offset = None
         self._is_alive = True
-        self._bodies_stub = BodiesStub(self._grpc_client.channel)
-        self._commands_stub = CommandsStub(self._grpc_client.channel)
+        self._bodies_stub = self._grpc_client._get_stub(BodiesStub)
+        self._commands_stub = self._grpc_client._get_stub(CommandsStub)
+        self._grpc_id_msg = EntityIdentifier(id=id)
         self._tessellation = None
+        self._tessellation_pdata = None
+        self._tessellation_merged = None
+        self._topology_cache = {}
 
-    def reset_tessellation_cache(func): # noqa: N805
-        """Decorate ``MasterBody`` methods that need tessellation cache update.
+    def reset_caches(func): # noqa: N805
+        """Decorate ``MasterBody`` methods that need tessellation and topology cache update.
 
         Parameters
         ----------
@@ -672,15 +743,19 @@ class MasterBody(IBody):
 
         @wraps(func)
         def wrapper(self: "MasterBody", *args, **kwargs):
-            self._tessellation = None
-            return func(self, *args, **kwargs)
+            # Caches are cleared once the method has run, since it may
+            # have to query the (outdated) topology of the body itself
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self.refresh()
 
         return wrapper
 
     @property
     def _grpc_id(self) -> EntityIdentifier:  # noqa: D102
         """Entity identifier of this body on the server side."""
-        return EntityIdentifier(id=self._id)
+        return self._grpc_id_msg
 
     @property
     def id(self) -> str:  # noqa: D102
@@ -703,8 +778,22 @@ class MasterBody(IBody):
         return self._surface_offset if self.is_surface else None
 
     @property
-    @protect_grpc
     def faces(self) -> List[Face]:  # noqa: D102
+        faces = self._topology_cache.get("faces")
+        if faces is None:
+            faces = self._topology_cache["faces"] = self._fetch_faces()
+        return list(faces)
+
+    @property
+    def edges(self) -> List[Edge]:  # noqa: D102
+        edges = self._topology_cache.get("edges")
+        if edges is None:
+            edges = self._topology_cache["edges"] = self._fetch_edges()
+        return list(edges)
+
+    @protect_grpc
+    def _fetch_faces(self) -> List[Face]:
+        """Retrieve the faces of the body from the server."""
         self._grpc_client.log.debug(f"Retrieving faces for body {self.id} from server.")
         grpc_faces = self._bodies_stub.GetFaces(self._grpc_id)
         return [
@@ -718,9 +807,9 @@ class MasterBody(IBody):
             for grpc_face in grpc_faces.faces
         ]
 
-    @property
     @protect_grpc
-    def edges(self) -> List[Edge]:  # noqa: D102
+    def _fetch_edges(self) -> List[Edge]:
+        """Retrieve the edges of the body from the server."""
         self._grpc_client.log.debug(f"Retrieving edges for body {self.id} from server.")
         grpc_edges = self._bodies_stub.GetEdges(self._grpc_id)
         return [
@@ -734,6 +823,12 @@ class MasterBody(IBody):
             for grpc_edge in grpc_edges.edges
         ]
 
+    def refresh(self) -> None:  # noqa: D102
+        self._tessellation = None
+        self._tessellation_pdata = None
+        self._tessellation_merged = None
+        self._topology_cache.clear()
+
     @property
     def is_alive(self) -> bool:  # noqa: D102
         return self._is_alive
@@ -753,25 +848,44 @@ class MasterBody(IBody):
             volume_response = self._bodies_stub.GetVolume(self._grpc_id)
             return Quantity(volume_response.volume, DEFAULT_UNITS.SERVER_VOLUME)
 
+    def _rollback_on_error(self, attribute: str, value) -> Callable[[], None]:
+        """Get a callback restoring ``attribute`` if an assignment of ``value`` fails.
+
+        The current value is restored only if ``value`` has not been replaced
+        by a later assignment in the meantime.
+        """
+        previous = getattr(self, attribute)
+
+        def rollback():
+            if getattr(self, attribute) is value:
+                setattr(self, attribute, previous)
+
+        return rollback
+
     @protect_grpc
     @check_input_types
     def assign_material(self, material: Material) -> None:  # noqa: D102
         self._grpc_client.log.debug(
             f"Assigning body {self.id} material {material.name}."
         )
-        self._bodies_stub.SetAssignedMaterial(
-            SetAssignedMaterialRequest(id=self._id, material=material.name)
+        self._grpc_client._add_pending_request(
+            self._bodies_stub.SetAssignedMaterial.future(
+                SetAssignedMaterialRequest(id=self._id, material=material.name)
+            )
         )
 
     @protect_grpc
     @check_input_types
     def add_midsurface_thickness(self, thickness: Quantity) -> None:  # noqa: D102
         if self.is_surface:
-            self._commands_stub.AssignMidSurfaceThickness(
-                AssignMidSurfaceThicknessRequest(
-                    bodies_or_faces=[self.id],
-                    thickness=thickness.m_as(DEFAULT_UNITS.SERVER_LENGTH),
-                )
+            self._grpc_client._add_pending_request(
+                self._commands_stub.AssignMidSurfaceThickness.future(
+                    AssignMidSurfaceThicknessRequest(
+                        bodies_or_faces=[self.id],
+                        thickness=thickness.m_as(DEFAULT_UNITS.SERVER_LENGTH),
+                    )
+                ),
+                on_error=self._rollback_on_error("_surface_thickness", thickness),
             )
             self._surface_thickness = thickness
         else:
@@ -783,10 +897,13 @@ class MasterBody(IBody):
     @check_input_types
     def add_midsurface_offset(self, offset: MidSurfaceOffsetType) -> None:  # noqa: D102
         if self.is_surface:
-            self._commands_stub.AssignMidSurfaceOffsetType(
-                AssignMidSurfaceOffsetTypeRequest(
-                    bodies_or_faces=[self.id], offset_type=offset.value
-                )
+            self._grpc_client._add_pending_request(
+                self._commands_stub.AssignMidSurfaceOffsetType.future(
+                    AssignMidSurfaceOffsetTypeRequest(
+                        bodies_or_faces=[self.id], offset_type=offset.value
+                    )
+                ),
+                on_error=self._rollback_on_error("_surface_offset", offset),
             )
             self._surface_offset = offset
         else:
@@ -840,27 +957,29 @@ class MasterBody(IBody):
 
     @protect_grpc
     @check_input_types
-    @reset_tessellation_cache
+    @reset_caches
     def translate(  # noqa: D102
         self, direction: UnitVector3D, distance: Union[Quantity, Distance, Real]
     ) -> None:
         distance = distance if isinstance(distance, Distance) else Distance(distance)
 
-        translation_magnitude = distance.value.m_as(DEFAULT_UNITS.SERVER_LENGTH)
+        translation_magnitude = _to_server_length(
+            distance._value, distance.base_unit, DEFAULT_UNITS.SERVER_LENGTH
+        )
 
         self._grpc_client.log.debug(f"Translating body {self.id}.")
 
         self._bodies_stub.Translate(
             TranslateRequest(
                 ids=[self.id],
-                direction=unit_vector_to_grpc_direction(direction),
+                direction=_grpc_direction(*direction.tolist()),
                 distance=translation_magnitude,
             )
         )
 
     @protect_grpc
     @check_input_types
-    @reset_tessellation_cache
+    @reset_caches
     @min_backend_version(24, 2, 0)
     def rotate(  # noqa: D102
         self,
@@ -882,7 +1001,7 @@ class MasterBody(IBody):
 
     @protect_grpc
     @check_input_types
-    @reset_tessellation_cache
+    @reset_caches
     @min_backend_version(24, 2, 0)
     def scale(self, value: Real) -> None:  # noqa: D102
         self._grpc_client.log.debug(f"Scaling body {self.id}.")
@@ -890,7 +1009,7 @@ class MasterBody(IBody):
 
     @protect_grpc
     @check_input_types
-    @reset_tessellation_cache
+    @reset_caches
     @min_backend_version(24, 2, 0)
     def map(self, frame: Frame) -> None:  # noqa: D102
         self._grpc_client.log.debug(f"Mapping body {self.id}.")
@@ -898,7 +1017,7 @@ class MasterBody(IBody):
 
     @protect_grpc
     @check_input_types
-    @reset_tessellation_cache
+    @reset_caches
     @min_backend_version(24, 2, 0)
     def mirror(self, plane: Plane) -> None:  # noqa: D102
         self._grpc_client.log.debug(f"Mirroring body {self.id}.")
@@ -931,6 +1050,9 @@ class MasterBody(IBody):
 
         self._grpc_client.log.debug(f"Copying body {self.id}.")
 
+        # Make sure that deferred assignments are applied to the copy as well
+        self._grpc_client.flush()
+
         # Perform copy request to server
         response = self._bodies_stub.Copy(
             CopyRequest(
@@ -960,17 +1082,55 @@ class MasterBody(IBody):
 
         self._grpc_client.log.debug(f"Requesting tessellation for body {self.id}.")
 
-        # cache tessellation
-        if not self._tessellation:
-            resp = self._bodies_stub.GetTessellation(self._grpc_id)
-            self._tessellation = resp.face_tessellation.values()
+        # cache tessellation, both raw and converted for the latest requested transform
+        transform_key = transform.tobytes()
+        if merge:
+            cached = self._tessellation_merged
+            if cached is not None and cached[0] == transform_key:
+                return cached[1].copy()
+
+        cached = self._tessellation_pdata
+        pdata = cached[1] if cached is not None and cached[0] == transform_key else None
+        if pdata is None:
+            if self._tessellation is None:
+                resp = self._bodies_stub.GetTessellation(self._grpc_id)
+                self._tessellation = resp.face_tessellation.values()
+
+            pdata = [tess_to_pd(tess) for tess in self._tessellation]
+            is_identity = transform is IDENTITY_MATRIX44 or np.array_equal(
+                transform, IDENTITY_MATRIX44
+            )
+            if pdata and not is_identity:
+                # Transform the points of all faces at once, instead of face by face
+                points = np.concatenate([face_pdata.points for face_pdata in pdata])
+                points = points @ transform[:3, :3].T + transform[:3, 3]
+                offsets = np.cumsum([face_pdata.n_points for face_pdata in pdata[:-1]])
+                for face_pdata, face_points in zip(pdata, np.split(points, offsets)):
+                    face_pdata.points = face_points
+
+            self._tessellation_pdata = (transform_key, pdata)
 
-        pdata = [tess_to_pd(tess).transform(transform) for tess in self._tessellation]
-        comp = pv.MultiBlock(pdata)
         if merge:
-            ugrid = comp.combine()
-            return pv.PolyData(ugrid.points, ugrid.cells, n_faces=ugrid.n_cells)
-        return comp
+            if not pdata:
+                return pv.PolyData()
+
+            # Stack the faces directly, shifting their point indices by the
+            # number of points of the preceding faces
+            points = np.concatenate([face_pdata.points for face_pdata in pdata])
+            point_offsets = np.cumsum([0] + [face_pdata.n_points for face_pdata in pdata[:-1]])
+            faces = []
+            for face_pdata, point_offset in zip(pdata, point_offsets):
+                polys = face_pdata.GetPolys()
+                connectivity = pv.convert_array(polys.GetConnectivityArray())
+                offsets = pv.convert_array(polys.GetOffsetsArray())
+                faces.append(np.insert(connectivity + point_offset, offsets[:-1], np.diff(offsets)))
+            n_faces = sum(face_pdata.n_cells for face_pdata in pdata)
+            merged = pv.PolyData(points, np.concatenate(faces), n_faces=n_faces)
+            self._tessellation_merged = (transform_key, merged)
+            return merged.copy()
+
+        # Deep copies keep the cached meshes safe from changes to the returned ones
+        return pv.MultiBlock([face_pdata.copy() for face_pdata in pdata])
 
     def plot(  # noqa: D102
         self,
@@ -1028,6 +1188,8 @@ class Body(IBody):
         Master body that this body is an occurrence of.
     """
 
+    __slots__ = ("_id", "_name", "_parent_component", "_template", "_grpc_id")
+
     def __init__(
         self, id, name, parent_component: "Component", template: MasterBody
     ) -> None:
@@ -1036,9 +1198,10 @@ class Body(IBody):
         self._name = name
         self._parent_component = parent_component
         self._template = template
+        self._grpc_id = EntityIdentifier(id=id)
 
-    def reset_tessellation_cache(func): # noqa: N805
-        """Decorate ``Body`` methods that require a tessellation cache update.
+    def reset_caches(func): # noqa: N805
+        """Decorate ``Body`` methods that require a tessellation and topology cache update.
 
         Parameters
         ----------
@@ -1053,8 +1216,12 @@ class Body(IBody):
 
         @wraps(func)
         def wrapper(self: "Body", *args, **kwargs):
-            self._template._tessellation = None
-            return func(self, *args, **kwargs)
+            # Caches are cleared once the method has run, since it may
+            # have to query the (outdated) topology of the body itself
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._template.refresh()
 
         return wrapper
 
@@ -1064,20 +1231,50 @@ class Body(IBody):
 
     @property
     def name(self) -> str:  # noqa: D102
-        return self._template.name
+        return self._template._name
 
     @property
     def parent_component(self) -> "Component":  # noqa: D102
         return self._parent_component
 
     @property
-    @protect_grpc
     @ensure_design_is_active
     def faces(self) -> List[Face]:  # noqa: D102
+        # Cached on the template by body ID, since ``Component.bodies`` returns
+        # a new ``Body`` instance on every access
+        topology_cache = self._template._topology_cache
+        faces = topology_cache.get((self._id, "faces"))
+        if faces is None:
+            faces = topology_cache[(self._id, "faces")] = self._fetch_faces()
+        return list(faces)
+
+    @property
+    @ensure_design_is_active
+    def edges(self) -> List[Edge]:  # noqa: D102
+        topology_cache = self._template._topology_cache
+        edges = topology_cache.get((self._id, "edges"))
+        if edges is None:
+            edges = topology_cache[(self._id, "edges")] = self._fetch_edges()
+        return list(edges)
+
+    @property
+    def _face_ids(self) -> FrozenSet[str]:
+        """IDs of the faces of the body."""
+        topology_cache = self._template._topology_cache
+        face_ids = topology_cache.get((self._id, "face_ids"))
+        if face_ids is None:
+            face_ids = topology_cache[(self._id, "face_ids")] = frozenset(
+                face.id for face in self.faces
+            )
+        return face_ids
+
+    @protect_grpc
+    def _fetch_faces(self) -> List[Face]:
+        """Retrieve the faces of the body from the server."""
         self._template._grpc_client.log.debug(
             f"Retrieving faces for body {self.id} from server."
         )
-        grpc_faces = self._template._bodies_stub.GetFaces(EntityIdentifier(id=self.id))
+        grpc_faces = self._template._bodies_stub.GetFaces(self._grpc_id)
         return [
             Face(
                 grpc_face.id,
@@ -1089,14 +1286,13 @@ class Body(IBody):
             for grpc_face in grpc_faces.faces
         ]
 
-    @property
     @protect_grpc
-    @ensure_design_is_active
-    def edges(self) -> List[Edge]:  # noqa: D102
+    def _fetch_edges(self) -> List[Edge]:
+        """Retrieve the edges of the body from the server."""
         self._template._grpc_client.log.debug(
             f"Retrieving edges for body {self.id} from server."
         )
-        grpc_edges = self._template._bodies_stub.GetEdges(EntityIdentifier(id=self.id))
+        grpc_edges = self._template._bodies_stub.GetEdges(self._grpc_id)
         return [
             Edge(
                 grpc_edge.id,
@@ -1108,9 +1304,12 @@ class Body(IBody):
             for grpc_edge in grpc_edges.edges
         ]
 
+    def refresh(self) -> None:  # noqa: D102
+        self._template.refresh()
+
     @property
     def _is_alive(self) -> bool:  # noqa: D102
-        return self._template.is_alive
+        return self._template._is_alive
 
     @_is_alive.setter
     def _is_alive(self, value: bool):  # noqa: D102
@@ -1118,11 +1317,11 @@ class Body(IBody):
 
     @property
     def is_alive(self) -> bool:  # noqa: D102
-        return self._is_alive
+        return self._template._is_alive
 
     @property
     def is_surface(self) -> bool:  # noqa: D102
-        return self._template.is_surface
+        return self._template._is_surface
 
     @property
     def _surface_thickness(self) -> Union[Quantity, None]:  # noqa: D102
@@ -1134,7 +1333,7 @@ class Body(IBody):
 
     @property
     def surface_thickness(self) -> Union[Quantity, None]:  # noqa: D102
-        return self._surface_thickness
+        return self._template.surface_thickness
 
     @property
     def _surface_offset(self) -> Union["MidSurfaceOffsetType", None]:  # noqa: D102
@@ -1146,7 +1345,7 @@ class Body(IBody):
 
     @property
     def surface_offset(self) -> Union["MidSurfaceOffsetType", None]:  # noqa: D102
-        return self._surface_offset
+        return self._template.surface_offset
 
     @property
     @ensure_design_is_active
@@ -1168,19 +1367,15 @@ class Body(IBody):
         self._template.add_midsurface_offset(offset)
 
     @protect_grpc
+    @reset_caches
     @ensure_design_is_active
     def imprint_curves(  # noqa: D102
         self, faces: List[Face], sketch: Sketch
     ) -> Tuple[List[Edge], List[Face]]:
         # Verify that each of the faces provided are part of this body
-        body_faces = self.faces
+        body_face_ids = self._face_ids
         for provided_face in faces:
-            is_found = False
-            for body_face in body_faces:
-                if provided_face.id == body_face.id:
-                    is_found = True
-                    break
-            if not is_found:
+            if provided_face.id not in body_face_ids:
                 raise ValueError(
                     f"Face with ID {provided_face.id} is not part of this body."
                 )
@@ -1193,9 +1388,7 @@ class Body(IBody):
         imprint_response = self._template._commands_stub.ImprintCurves(
             ImprintCurvesRequest(
                 body=self._id,
-                curves=sketch_shapes_to_grpc_geometries(
-                    sketch._plane, sketch.edges, sketch.faces
-                ),
+                curves=sketch._as_grpc_geometries(),
                 faces=[face._id for face in faces],
             )
         )
@@ -1231,9 +1424,7 @@ class Body(IBody):
         closest_face: bool,
         only_one_curve: Optional[bool] = False,
     ) -> List[Face]:
-        curves = sketch_shapes_to_grpc_geometries(
-            sketch._plane, sketch.edges, sketch.faces, only_one_curve=only_one_curve
-        )
+        curves = sketch._as_grpc_geometries(only_one_curve=only_one_curve)
         self._template._grpc_client.log.debug(
             f"Projecting provided curves on {self.id}."
         )
@@ -1261,6 +1452,7 @@ class Body(IBody):
 
     @check_input_types
     @protect_grpc
+    @reset_caches
     @ensure_design_is_active
     def imprint_projected_curves(  # noqa: D102
         self,
@@ -1269,9 +1461,7 @@ class Body(IBody):
         closest_face: bool,
         only_one_curve: Optional[bool] = False,
     ) -> List[Face]:
-        curves = sketch_shapes_to_grpc_geometries(
-            sketch._plane, sketch.edges, sketch.faces, only_one_curve=only_one_curve
-        )
+        curves = sketch._as_grpc_geometries(only_one_curve=only_one_curve)
         self._template._grpc_client.log.debug(
             f"Projecting provided curves on {self.id}."
         )
@@ -1370,7 +1560,7 @@ class Body(IBody):
         self.__generic_boolean_op(other, "unite", "union operation failed")
 
     @protect_grpc
-    @reset_tessellation_cache
+    @reset_caches
     @ensure_design_is_active
     @check_input_types
     def __generic_boolean_op(
@@ -1420,15 +1610,19 @@ class Body(IBody):
 
     def __repr__(self) -> str:
         """Represent the ``Body`` as a string."""
-        lines = [f"ansys.geometry.core.designer.Body {hex(id(self))}"]
-        lines.append(f"  Name                 : {self.name}")
-        lines.append(f"  Exists               : {self.is_alive}")
-        lines.append(f"  Parent component     : {self._parent_component.name}")
-        lines.append(f"  MasterBody           : {self._template.id}")
-        lines.append(f"  Surface body         : {self.is_surface}")
-        if self.is_surface:
-            lines.append(f"  Surface thickness    : {self.surface_thickness}")
-            lines.append(f"  Surface offset       : {self.surface_offset}")
-
-        nl = "\n"
-        return f"{nl}{nl.join(lines)}{nl}"
+        is_surface = self.is_surface
+        surface_info = (
+            f"  Surface thickness    : {self.surface_thickness}\n"
+            f"  Surface offset       : {self.surface_offset}\n"
+            if is_surface
+            else ""
+        )
+        return (
+            f"\nansys.geometry.core.designer.Body {hex(id(self))}\n"
+            f"  Name                 : {self.name}\n"
+            f"  Exists               : {self.is_alive}\n"
+            f"  Parent component     : {self._parent_component.name}\n"
+            f"  MasterBody           : {self._template.id}\n"
+            f"  Surface body         : {is_surface}\n"
+            f"{surface_info}"
+        )
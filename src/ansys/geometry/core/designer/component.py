@@ -21,6 +21,7 @@
 # SOFTWARE.
 """Provides for managing components."""
 
+from contextlib import contextmanager
 from enum import Enum, unique
 import uuid  # TODO: Is ID even needed? Maybe use from SC?
 
@@ -47,7 +48,7 @@ from ansys.api.geometry.v0.components_pb2 import (
 from ansys.api.geometry.v0.components_pb2_grpc import ComponentsStub
 from ansys.api.geometry.v0.models_pb2 import Direction, Line, TrimmedCurveList
 from beartype import beartype as check_input_types
-from beartype.typing import TYPE_CHECKING, List, Optional, Tuple, Union
+from beartype.typing import TYPE_CHECKING, Generator, List, Optional, Tuple, Union
 from pint import Quantity
 
 from ansys.geometry.core.connection.client import GrpcClient
@@ -55,7 +56,6 @@ from ansys.geometry.core.connection.conversions import (
     grpc_matrix_to_matrix,
     plane_to_grpc_plane,
     point3d_to_grpc_point,
-    sketch_shapes_to_grpc_geometries,
     trimmed_curve_to_grpc_trimmed_curve,
     unit_vector_to_grpc_direction,
 )
@@ -196,6 +196,8 @@ class Component:
         self._is_alive = True
         self._shared_topology = None
         self._master_component = master_component
+        self._world_transform_cache: Optional[Tuple[int, Matrix44]] = None
+        self._pending_deletions: Optional[List[Body]] = None
 
         # Populate client data model
         if template:
@@ -302,10 +304,24 @@ class Component:
         -------
         Matrix44
             4x4 transformation matrix of the component in world space.
+
+        Notes
+        -----
+        The matrix is cached and recomputed only after a master component
+        transform has changed anywhere in the design. A copy of the cached
+        matrix is returned, so it can be freely modified.
         """
-        if self.parent_component is None:
-            return IDENTITY_MATRIX44
-        return self.parent_component.get_world_transform() * self._master_component.transform
+        version = MasterComponent._transform_version
+        cached = self._world_transform_cache
+        if cached is None or cached[0] != version:
+            if self.parent_component is None:
+                matrix = IDENTITY_MATRIX44
+            else:
+                matrix = (
+                    self.parent_component.get_world_transform() * self._master_component.transform
+                )
+            cached = self._world_transform_cache = (version, matrix)
+        return cached[1].copy()
 
     @protect_grpc
     @ensure_design_is_active
@@ -470,7 +486,7 @@ class Component:
             distance=distance.value.m_as(DEFAULT_UNITS.SERVER_LENGTH),
             parent=self.id,
             plane=plane_to_grpc_plane(sketch._plane),
-            geometries=sketch_shapes_to_grpc_geometries(sketch._plane, sketch.edges, sketch.faces),
+            geometries=sketch._as_grpc_geometries(),
             name=name,
         )
 
@@ -523,7 +539,7 @@ class Component:
             name=name,
             parent=self.id,
             plane=plane_to_grpc_plane(sketch._plane),
-            geometries=sketch_shapes_to_grpc_geometries(sketch._plane, sketch.edges, sketch.faces),
+            geometries=sketch._as_grpc_geometries(),
             path=path_grpc,
         )
 
@@ -834,7 +850,7 @@ class Component:
         request = CreatePlanarBodyRequest(
             parent=self.id,
             plane=plane_to_grpc_plane(sketch._plane),
-            geometries=sketch_shapes_to_grpc_geometries(sketch._plane, sketch.edges, sketch.faces),
+            geometries=sketch._as_grpc_geometries(),
             name=name,
         )
 
@@ -936,11 +952,13 @@ class Component:
         None
         """
         body_ids_found = []
+        bodies_found = []
 
         for body in bodies:
             body_requested = self.search_body(body.id)
             if body_requested:
                 body_ids_found.append(body_requested.id)
+                bodies_found.append(body_requested)
             else:
                 self._grpc_client.log.warning(
                     f"Body with ID {body.id} and name {body.name} is not found in this "
@@ -961,6 +979,10 @@ class Component:
             )
         )
 
+        # Clear the cached tessellation and topology of the translated bodies
+        for body in bodies_found:
+            body.refresh()
+
     @protect_grpc
     @check_input_types
     @ensure_design_is_active
@@ -1077,6 +1099,17 @@ class Component:
         body_requested = self.search_body(id)
 
         if body_requested:
+            pending_deletions = self.__get_pending_deletions()
+            if pending_deletions is not None:
+                # Inside a deletion batch: "kill" the body on the client side now and
+                # defer the server deletion until the batch ends
+                body_requested._is_alive = False
+                pending_deletions.append(body_requested)
+                self._grpc_client.log.debug(
+                    f"Body {body_requested.id} has been scheduled for deletion."
+                )
+                return
+
             # If the body belongs to this component (or nested components)
             # call the server deletion mechanism
             self._bodies_stub.Delete(EntityIdentifier(id=id))
@@ -1092,6 +1125,66 @@ class Component:
             )
             pass
 
+    @contextmanager
+    def batch_deletions(self) -> Generator[None, None, None]:
+        """Defer body deletions within this component (or its children).
+
+        Inside the ``with`` block, deleted bodies, including the tool bodies
+        consumed by Boolean operations, are immediately marked as not alive on the
+        client side. Their server deletions are sent together when the block
+        ends, and the method waits for all of them before returning.
+
+        Notes
+        -----
+        Until the block ends, the deleted bodies still exist on the server side.
+        If a deletion fails, the body is marked as alive again and the first
+        error is raised once all deletions have been processed.
+
+        Examples
+        --------
+        >>> with design.batch_deletions():
+        ...     for tool in tools:
+        ...         body.subtract(tool)
+        """
+        if self.__get_pending_deletions() is not None:
+            # Nested batch: the outermost one sends the deletions
+            yield
+            return
+
+        self._pending_deletions = []
+        try:
+            yield
+        finally:
+            pending, self._pending_deletions = self._pending_deletions, None
+            self.__delete_bodies(pending)
+
+    def __get_pending_deletions(self) -> Optional[List[Body]]:
+        """Get the deletions deferred by the batch this component belongs to, if any."""
+        component = self
+        while component is not None:
+            if component._pending_deletions is not None:
+                return component._pending_deletions
+            component = component.parent_component
+        return None
+
+    @protect_grpc
+    def __delete_bodies(self, bodies: List[Body]) -> None:
+        """Send the deletion of several bodies and wait for all of them."""
+        futures = [self._bodies_stub.Delete.future(body._grpc_id) for body in bodies]
+        errors = []
+        for body, future in zip(bodies, futures):
+            try:
+                future.result()
+            except Exception as err:
+                body._is_alive = True
+                errors.append(err)
+                self._grpc_client.log.error(f"Body {body.id} could not be deleted: {err}")
+            else:
+                self._grpc_client.log.debug(f"Body {body.id} has been deleted.")
+
+        if errors:
+            raise errors[0]
+
     def add_design_point(
         self,
         name: str,
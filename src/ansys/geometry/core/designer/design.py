@@ -231,6 +231,8 @@ class Design(Component):
         if isinstance(file_location, Path):
             file_location = str(file_location)
 
+        # Make sure that deferred requests are applied before saving
+        self._grpc_client.flush()
         self._design_stub.SaveAs(SaveAsRequest(filepath=file_location))
         self._grpc_client.log.debug(f"Design successfully saved at location {file_location}.")
 
@@ -260,6 +262,9 @@ class Design(Component):
             # Create the parent directory
             file_location.parent.mkdir(parents=True, exist_ok=True)
 
+        # Make sure that deferred requests are applied before downloading
+        self._grpc_client.flush()
+
         # Process response
         self._grpc_client.log.debug(f"Requesting design download in {format.value[0]} format.")
         received_bytes = bytes()
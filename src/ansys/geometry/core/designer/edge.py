@@ -73,6 +73,18 @@ class Edge:
         Direction of the edge.
     """
 
+    __slots__ = (
+        "_id",
+        "_curve_type",
+        "_body",
+        "_grpc_client",
+        "_edges_stub",
+        "_is_reversed",
+        "_shape",
+        "_grpc_id_msg",
+        "_faces",
+    )
+
     def __init__(
         self,
         id: str,
@@ -86,9 +98,11 @@ class Edge:
         self._curve_type = curve_type
         self._body = body
         self._grpc_client = grpc_client
-        self._edges_stub = EdgesStub(grpc_client.channel)
+        self._edges_stub = grpc_client._get_stub(EdgesStub)
         self._is_reversed = is_reversed
         self._shape = None
+        self._grpc_id_msg = None
+        self._faces = None
 
     @property
     def id(self) -> str:
@@ -98,7 +112,10 @@ class Edge:
     @property
     def _grpc_id(self) -> EntityIdentifier:
         """Entity ID of this edge on the server side."""
-        return EntityIdentifier(id=self._id)
+        # Built on first use and reused for every later request
+        if self._grpc_id_msg is None:
+            self._grpc_id_msg = EntityIdentifier(id=self._id)
+        return self._grpc_id_msg
 
     @property
     def is_reversed(self) -> bool:
@@ -161,20 +178,22 @@ class Edge:
     @ensure_design_is_active
     def faces(self) -> List["Face"]:
         """Faces that contain the edge."""
-        from ansys.geometry.core.designer.face import Face, SurfaceType
-
-        self._grpc_client.log.debug("Requesting edge faces from server.")
-        grpc_faces = self._edges_stub.GetFaces(self._grpc_id).faces
-        return [
-            Face(
-                grpc_face.id,
-                SurfaceType(grpc_face.surface_type),
-                self._body,
-                self._grpc_client,
-                grpc_face.is_reversed,
-            )
-            for grpc_face in grpc_faces
-        ]
+        if self._faces is None:
+            from ansys.geometry.core.designer.face import Face, SurfaceType
+
+            self._grpc_client.log.debug("Requesting edge faces from server.")
+            grpc_faces = self._edges_stub.GetFaces(self._grpc_id).faces
+            self._faces = [
+                Face(
+                    grpc_face.id,
+                    SurfaceType(grpc_face.surface_type),
+                    self._body,
+                    self._grpc_client,
+                    grpc_face.is_reversed,
+                )
+                for grpc_face in grpc_faces
+            ]
+        return list(self._faces)
 
     @property
     @protect_grpc
@@ -161,6 +161,18 @@ class Face:
         Active supporting Geometry service instance for design modeling.
     """
 
+    __slots__ = (
+        "_id",
+        "_surface_type",
+        "_body",
+        "_grpc_client",
+        "_faces_stub",
+        "_edges_stub",
+        "_is_reversed",
+        "_shape",
+        "_grpc_id_msg",
+    )
+
     def __init__(
         self,
         id: str,
@@ -174,10 +186,11 @@ class Face:
         self._surface_type = surface_type
         self._body = body
         self._grpc_client = grpc_client
-        self._faces_stub = FacesStub(grpc_client.channel)
-        self._edges_stub = EdgesStub(grpc_client.channel)
+        self._faces_stub = grpc_client._get_stub(FacesStub)
+        self._edges_stub = grpc_client._get_stub(EdgesStub)
         self._is_reversed = is_reversed
         self._shape = None
+        self._grpc_id_msg = None
 
         self._grpc_client.log.debug("Requesting surface properties from server.")
 
@@ -189,7 +202,10 @@ class Face:
     @property
     def _grpc_id(self) -> EntityIdentifier:
         """Entity ID of this face on the server side."""
-        return EntityIdentifier(id=self._id)
+        # Built on first use and reused for every later request
+        if self._grpc_id_msg is None:
+            self._grpc_id_msg = EntityIdentifier(id=self._id)
+        return self._grpc_id_msg
 
     @property
     def is_reversed(self) -> bool:
@@ -118,6 +118,12 @@ class MasterComponent:
         4x4 transformation matrix from the master part.
     """
 
+    _transform_version: int = 0
+    """Counter bumped whenever any master component transform changes.
+
+    Components use it to invalidate their cached world transforms.
+    """
+
     def __init__(
         self, id: str, name: str, part: Part, transform: Matrix44 = IDENTITY_MATRIX44
     ) -> None:
@@ -157,6 +163,7 @@ class MasterComponent:
     @transform.setter
     def transform(self, matrix: Matrix44) -> None:
         self._transform = matrix
+        MasterComponent._transform_version += 1
 
     def __repr__(self) -> str:
         """Represent the master component as a string."""
@@ -29,7 +29,9 @@ from grpc._channel import _InactiveRpcError, _MultiThreadedRendezvous
 
 from ansys.geometry.core.logger import LOG
 
-SIGINT_TRACKER = []
+# Per-thread state of ``protect_grpc``: nesting depth of the protected calls
+# and whether a SIGINT was received while they ran
+_PROTECT_GRPC_STATE = threading.local()
 
 
 class GeometryRuntimeError(RuntimeError):
@@ -56,7 +58,7 @@ class GeometryExitedError(RuntimeError):
 def handler(sig, frame):  # pragma: no cover
     """Pass signal to the custom interrupt handler."""
     LOG.info("KeyboardInterrupt received. Waiting until Geometry service execution finishes.")
-    SIGINT_TRACKER.append(True)
+    _PROTECT_GRPC_STATE.interrupted = True
 
 
 def protect_grpc(func):
@@ -85,11 +87,20 @@ def protect_grpc(func):
         KeyboardInterrupt
             If a KeyboardInterrupt error is observed.
         """
-        # capture KeyboardInterrupt
+        state = _PROTECT_GRPC_STATE
+
+        # capture KeyboardInterrupt. Only the outermost call of the main thread
+        # swaps the SIGINT handler, nested calls reuse the one already in place.
+        in_main_thread = threading.current_thread() is threading.main_thread()
         old_handler = None
-        if threading.current_thread().__class__.__name__ == "_MainThread":
-            if threading.current_thread().is_alive():
-                old_handler = signal.signal(signal.SIGINT, handler)
+        received_interrupt = False
+        if in_main_thread:
+            depth = getattr(state, "depth", 0)
+            if depth == 0:
+                state.interrupted = False
+                if threading.main_thread().is_alive():
+                    old_handler = signal.signal(signal.SIGINT, handler)
+            state.depth = depth + 1
 
         # Capture gRPC exceptions
         try:
@@ -98,17 +109,19 @@ def protect_grpc(func):
             raise GeometryExitedError(
                 f"Geometry service connection terminated: {error.details()}"
             ) from None
-
-        if threading.current_thread().__class__.__name__ == "_MainThread":
-            received_interrupt = bool(SIGINT_TRACKER)
-
-            # always clear and revert to old handler
-            SIGINT_TRACKER.clear()
-            if old_handler:
-                signal.signal(signal.SIGINT, old_handler)
-
-            if received_interrupt:  # pragma: no cover
-                raise KeyboardInterrupt("Interrupted during Geometry service execution")
+        finally:
+            if in_main_thread:
+                state.depth -= 1
+                if state.depth == 0:
+                    received_interrupt = state.interrupted
+
+                    # always clear and revert to old handler
+                    state.interrupted = False
+                    if old_handler is not None:
+                        signal.signal(signal.SIGINT, old_handler)
+
+        if received_interrupt:  # pragma: no cover
+            raise KeyboardInterrupt("Interrupted during Geometry service execution")
 
         return out
 
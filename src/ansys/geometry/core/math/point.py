@@ -94,6 +94,9 @@ class Point2D(np.ndarray, PhysicalQuantity):
     @check_input_types
     def __eq__(self, other: "Point2D") -> bool:
         """Equals operator for the ``Point2D`` class."""
+        if isinstance(other, np.ndarray):
+            # Comparing plain lists avoids ``np.array_equal`` dispatch overhead
+            return self.shape == other.shape and self.tolist() == other.tolist()
         return np.array_equal(self, other)
 
     def __ne__(self, other: "Point2D") -> bool:
@@ -220,6 +223,9 @@ class Point3D(np.ndarray, PhysicalQuantity):
     @check_input_types
     def __eq__(self, other: "Point3D") -> bool:
         """Equals operator for the ``Point3D`` class."""
+        if isinstance(other, np.ndarray):
+            # Comparing plain lists avoids ``np.array_equal`` dispatch overhead
+            return self.shape == other.shape and self.tolist() == other.tolist()
         return np.array_equal(self, other)
 
     def __ne__(self, other: "Point3D") -> bool:
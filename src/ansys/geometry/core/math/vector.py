@@ -103,7 +103,7 @@ class Vector3D(np.ndarray):
     @property
     def is_zero(self) -> bool:
         """Check if all components of the 3D vector are zero."""
-        return all([comp == 0 for comp in self])
+        return not any(self.tolist())
 
     @check_input_types
     def is_perpendicular_to(self, other_vector: "Vector3D") -> bool:
@@ -119,7 +119,10 @@ class Vector3D(np.ndarray):
         if self.is_zero or other_vector.is_zero:
             return False
         else:
-            return (self % other_vector).is_zero
+            # Cross product components computed on floats: cheaper than
+            # ``np.cross`` for a single pair of 3D vectors
+            (x1, y1, z1), (x2, y2, z2) = self.tolist(), other_vector.tolist()
+            return y1 * z2 - z1 * y2 == 0 and z1 * x2 - x1 * z2 == 0 and x1 * y2 - y1 * x2 == 0
 
     @check_input_types
     def is_opposite(self, other_vector: "Vector3D") -> bool:
@@ -190,7 +193,8 @@ class Vector3D(np.ndarray):
     @check_input_types
     def cross(self, v: "Vector3D") -> "Vector3D":
         """Get the cross product of ``Vector3D`` objects."""
-        return np.cross(self, v).view(Vector3D)
+        (x1, y1, z1), (x2, y2, z2) = self.tolist(), v.tolist()
+        return np.array([y1 * z2 - z1 * y2, z1 * x2 - x1 * z2, x1 * y2 - y1 * x2]).view(Vector3D)
 
     @check_input_types
     def __eq__(self, other: "Vector3D") -> bool:
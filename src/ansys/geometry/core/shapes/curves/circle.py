@@ -82,6 +82,10 @@ class Circle(Curve):
         if self._radius.value <= 0:
             raise ValueError("Radius must be a real positive value.")
 
+        # Derived measurements, cached along with the radius they were computed for
+        self._perimeter = None
+        self._area = None
+
     @property
     def origin(self) -> Point3D:
         """Origin of the circle."""
@@ -100,12 +104,20 @@ class Circle(Curve):
     @property
     def perimeter(self) -> Quantity:
         """Perimeter of the circle."""
-        return 2 * np.pi * self.radius
+        radius = self.radius
+        key = (radius.m, radius.units)
+        if self._perimeter is None or self._perimeter[0] != key:
+            self._perimeter = (key, 2 * np.pi * radius)
+        return self._perimeter[1]
 
     @property
     def area(self) -> Quantity:
         """Area of the circle."""
-        return np.pi * self.radius**2
+        radius = self.radius
+        key = (radius.m, radius.units)
+        if self._area is None or self._area[0] != key:
+            self._area = (key, np.pi * radius**2)
+        return self._area[1]
 
     @property
     def dir_x(self) -> UnitVector3D:
@@ -278,10 +290,8 @@ class CircleEvaluation(CurveEvaluation):
         Point3D
             Point that lies on the circle at this evaluation.
         """
-        return (
-            self.circle.origin
-            + ((self.circle.radius * np.cos(self.parameter)) * self.circle.dir_x).m
-            + ((self.circle.radius * np.sin(self.parameter)) * self.circle.dir_y).m
+        return self.circle.origin + self.circle.radius.m * (
+            np.cos(self.parameter) * self.circle.dir_x + np.sin(self.parameter) * self.circle.dir_y
         )
 
     @cached_property
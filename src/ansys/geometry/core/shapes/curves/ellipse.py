@@ -27,7 +27,7 @@ from beartype import beartype as check_input_types
 from beartype.typing import Union
 import numpy as np
 from pint import Quantity
-from scipy.integrate import quad
+from scipy.special import ellipe
 
 from ansys.geometry.core.math.constants import UNITVECTOR3D_X, UNITVECTOR3D_Z
 from ansys.geometry.core.math.matrix import Matrix44
@@ -247,12 +247,8 @@ class Ellipse(Curve):
     @property
     def perimeter(self) -> Quantity:
         """Perimeter of the ellipse."""
-
-        def integrand(theta, ecc):
-            return np.sqrt(1 - (ecc * np.sin(theta)) ** 2)
-
-        integral, _ = quad(integrand, 0, np.pi / 2, args=(self.eccentricity,))
-        return 4 * self.major_radius * integral
+        # Complete elliptic integral of the second kind, with parameter m = e^2
+        return 4 * self.major_radius * float(ellipe(self.eccentricity**2))
 
     @property
     def area(self) -> Quantity:
@@ -147,6 +147,8 @@ class Interval:
         End value of the interval.
     """
 
+    __slots__ = ("_start", "_end", "not_empty")
+
     @check_input_types
     def __init__(self, start: Real, end: Real) -> None:
         """Initialize ``Interval`` class."""
@@ -197,7 +199,7 @@ class Interval:
         bool
             True if neither bound of the interval is infinite.
         """
-        return self.start > -np.inf and self.end < np.inf
+        return self._start > -np.inf and self._end < np.inf
 
     def is_empty(self) -> bool:
         """Check if the current interval is empty.
@@ -252,7 +254,7 @@ class Interval:
         bool
             ``True`` if the interval is negative, ``False`` otherwise.
         """
-        return Accuracy.compare_with_tolerance(self.get_span(), 0, tolerance, tolerance)
+        return Accuracy.compare_with_tolerance(self.get_span(), 0, tolerance, tolerance) < 0
 
     @staticmethod
     def unite(first: "Interval", second: "Interval") -> "Interval":
@@ -284,7 +286,8 @@ class Interval:
         other : Interval
             Interval to unite with.
         """
-        self = Interval.unite(self, other)
+        union = Interval.unite(self, other)
+        self._start, self._end, self.not_empty = union._start, union._end, union.not_empty
 
     @staticmethod
     def intersect(first: "Interval", second: "Interval", tolerance: Real) -> "Interval":
@@ -304,10 +307,11 @@ class Interval:
         """
         if first.is_empty() or second.is_empty():
             return None  # supposed to be empty
-        intersection = Interval(max(first.start, second.start), min(first.end, second.send))
-        if not intersection.is_negative(tolerance):
-            return intersection
-        return None  # supposed to be empty
+        start, end = max(first.start, second.start), min(first.end, second.end)
+        if Accuracy.compare_with_tolerance(end - start, 0, tolerance, tolerance) < 0:
+            return None  # supposed to be empty
+        # Intervals touching within the tolerance intersect in a single value
+        return Interval(start, max(start, end))
 
     def self_intersect(self, other: "Interval", tolerance: Real) -> None:
         """Get the intersection of two intervals and update the current one.
@@ -319,7 +323,11 @@ class Interval:
         tolerance : Real
             Accepted range of error given that the interval could be in float values.
         """
-        self = Interval.intersect(self, other, tolerance)
+        intersection = Interval.intersect(self, other, tolerance)
+        if intersection is None:
+            self.not_empty = False
+        else:
+            self._start, self._end = intersection._start, intersection._end
 
     def contains_value(self, t: Real, accuracy: Real) -> bool:
         """Check if the current interval contains the value ``t``.
@@ -23,6 +23,7 @@
 
 from beartype import beartype as check_input_types
 from beartype.typing import Optional, Union
+import numpy as np
 from pint import Quantity
 import pyvista as pv
 from scipy.spatial.transform import Rotation as SpatialRotation
@@ -85,15 +86,18 @@ class Box(SketchFace):
 
         half_h = height_magnitude / 2
         half_w = width_magnitude / 2
-        corner_1 = rotation @ [-half_w, half_h, 0]
-        corner_2 = rotation @ [half_w, half_h, 0]
-        corner_3 = rotation @ [half_w, -half_h, 0]
-        corner_4 = rotation @ [-half_w, -half_h, 0]
-
-        self._corner_1 = Point2D([center.x.m + corner_1[0], center.y.m + corner_1[1]], center.unit)
-        self._corner_2 = Point2D([center.x.m + corner_2[0], center.y.m + corner_2[1]], center.unit)
-        self._corner_3 = Point2D([center.x.m + corner_3[0], center.y.m + corner_3[1]], center.unit)
-        self._corner_4 = Point2D([center.x.m + corner_4[0], center.y.m + corner_4[1]], center.unit)
+        corners = np.array(
+            [
+                [-half_w, half_h, 0],
+                [half_w, half_h, 0],
+                [half_w, -half_h, 0],
+                [-half_w, -half_h, 0],
+            ]
+        ) @ np.asarray(rotation)[:2].T + [center.x.m, center.y.m]
+
+        self._corner_1, self._corner_2, self._corner_3, self._corner_4 = (
+            Point2D(corner, center.unit) for corner in corners
+        )
 
         # TODO: add plane to SketchSegment when available
         self._width_segment1 = SketchSegment(self._corner_1, self._corner_2)
@@ -124,12 +128,14 @@ class Box(SketchFace):
     @property
     def perimeter(self) -> Quantity:
         """Perimeter of the box."""
-        return 2 * self.width + 2 * self.height
+        width = self.width
+        return Quantity(2 * width.m + 2 * self.height.m_as(width.units), width.units)
 
     @property
     def area(self) -> Quantity:
         """Area of the box."""
-        return self.width * self.height
+        width, height = self.width, self.height
+        return Quantity(width.m * height.m, width.units * height.units)
 
     @property
     def visualization_polydata(self) -> pv.PolyData:
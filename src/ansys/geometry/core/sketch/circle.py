@@ -21,8 +21,11 @@
 # SOFTWARE.
 """Provides for creating and managing a circle."""
 
+from functools import lru_cache
+
 from beartype import beartype as check_input_types
-from beartype.typing import Optional, Union
+from beartype.typing import Optional, Tuple, Union
+import numpy as np
 from pint import Quantity
 import pyvista as pv
 
@@ -33,6 +36,23 @@ from ansys.geometry.core.shapes.curves.circle import Circle
 from ansys.geometry.core.sketch.face import SketchFace
 from ansys.geometry.core.typing import Real
 
+_CIRCLE_RESOLUTION = 100
+"""Number of points used to discretize a circle, matching the ``pyvista.Circle`` default."""
+
+
+@lru_cache(maxsize=32)
+def _unit_circle(resolution: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Get the cosines, sines, and face cells of a unit circle discretization.
+
+    The arrays are shared between calls and flagged as read-only.
+    """
+    theta = np.linspace(0.0, 2.0 * np.pi, resolution, endpoint=False)
+    cos, sin = np.cos(theta), np.sin(theta)
+    cells = np.append(resolution, np.arange(resolution))
+    for array in (cos, sin, cells):
+        array.flags.writeable = False
+    return cos, sin, cells
+
 
 class SketchCircle(SketchFace, Circle):
     """Provides for modeling a circle.
@@ -116,15 +136,12 @@ class SketchCircle(SketchFace, Circle):
         pyvista.PolyData
             VTK pyvista.Polydata configuration.
         """
-        circle = pv.Circle(self.radius.m_as(DEFAULT_UNITS.LENGTH))
-        return circle.translate(
-            [
-                self.center.x.m_as(DEFAULT_UNITS.LENGTH),
-                self.center.y.m_as(DEFAULT_UNITS.LENGTH),
-                0,
-            ],
-            inplace=True,
-        )
+        cos, sin, cells = _unit_circle(_CIRCLE_RESOLUTION)
+        radius = self.radius.m_as(DEFAULT_UNITS.LENGTH)
+        points = np.zeros((len(cos), 3))
+        points[:, 0] = radius * cos + self.center.x.m_as(DEFAULT_UNITS.LENGTH)
+        points[:, 1] = radius * sin + self.center.y.m_as(DEFAULT_UNITS.LENGTH)
+        return pv.PolyData(points, cells, deep=True)
 
     def plane_change(self, plane: Plane) -> None:
         """Redefine the plane containing the ``SketchCircle`` objects.
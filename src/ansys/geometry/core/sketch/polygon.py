@@ -100,22 +100,26 @@ class Polygon(SketchFace):
     @property
     def length(self) -> Quantity:
         """Side length of the polygon."""
-        return 2 * self.inner_radius * np.tan(np.pi / self.n_sides)
+        radius = self.inner_radius
+        return Quantity(2 * radius.m * np.tan(np.pi / self.n_sides), radius.units)
 
     @property
     def outer_radius(self) -> Quantity:
         """Outer radius of the polygon."""
-        return self.inner_radius / np.cos(np.pi / self.n_sides)
+        radius = self.inner_radius
+        return Quantity(radius.m / np.cos(np.pi / self.n_sides), radius.units)
 
     @property
     def perimeter(self) -> Quantity:
         """Perimeter of the polygon."""
-        return self.n_sides * self.length
+        length = self.length
+        return Quantity(self.n_sides * length.m, length.units)
 
     @property
     def area(self) -> Quantity:
         """Area of the polygon."""
-        return (self.inner_radius * self.perimeter) / 2
+        radius = self.inner_radius
+        return Quantity(radius.m * self.perimeter.m / 2, radius.units**2)
 
     @property
     def visualization_polydata(self) -> pv.PolyData:
@@ -45,6 +45,7 @@ from ansys.geometry.core.sketch.triangle import Triangle
 from ansys.geometry.core.typing import Real
 
 if TYPE_CHECKING:  # pragma: no cover
+    from ansys.api.geometry.v0.models_pb2 import Geometries as GRPCGeometries
     from pyvista import PolyData
 
 SketchObject = Union[SketchEdge, SketchFace]
@@ -59,6 +60,7 @@ class Sketch:
     _edges: List[SketchEdge]
     _current_sketch_context: List[SketchObject]
     _tags: Dict[str, List[SketchObject]]
+    _grpc_geometries_cache: Dict[bool, tuple]
 
     @check_input_types
     def __init__(
@@ -77,6 +79,9 @@ class Sketch:
         # sketch objects and collections of sketch objects
         self._tags = {}
 
+        # cache of the gRPC geometries message, keyed by ``only_one_curve``
+        self._grpc_geometries_cache = {}
+
     @property
     def plane(self) -> Plane:
         """Sketch plane configuration."""
@@ -109,6 +114,7 @@ class Sketch:
             New plane for the sketch planar orientation.
         """
         self._plane = plane
+        self._grpc_geometries_cache.clear()
         [face.plane_change(plane) for face in self.faces]
         [edge.plane_change(plane) for edge in self.edges]
 
@@ -230,6 +236,7 @@ class Sketch:
             Revised sketch state ready for further sketch actions.
         """
         self._faces.append(face)
+        self._grpc_geometries_cache.clear()
         if tag:
             self._tag([face], tag)
 
@@ -252,6 +259,7 @@ class Sketch:
             Revised sketch state ready for further sketch actions.
         """
         self._edges.append(edge)
+        self._grpc_geometries_cache.clear()
         if tag:
             self._tag([edge], tag)
 
@@ -840,6 +848,42 @@ class Sketch:
         """
         self._tags[tag] = self._current_sketch_context
 
+    def _as_grpc_geometries(self, only_one_curve: bool = False) -> "GRPCGeometries":
+        """Get the sketch shapes as a gRPC geometries message.
+
+        Parameters
+        ----------
+        only_one_curve : bool, default: False
+            Whether to only convert one curve of the whole set of geometries.
+
+        Returns
+        -------
+        GRPCGeometries
+            Geometry service gRPC geometries message.
+
+        Notes
+        -----
+        The message is cached and reused for as long as the sketch plane, edges,
+        and faces are unchanged. It is shared between calls and must not be modified.
+        The cache is cleared when the sketch plane is set or translated and when a
+        shape is added. In-place changes to the points of a shape already in the
+        sketch are not tracked.
+        """
+        from ansys.geometry.core.connection.conversions import sketch_shapes_to_grpc_geometries
+
+        shapes = (self._plane, *self._edges, *self._faces)
+        cached = self._grpc_geometries_cache.get(only_one_curve)
+        if (
+            cached is None
+            or len(cached[0]) != len(shapes)
+            or any(old is not new for old, new in zip(cached[0], shapes))
+        ):
+            geometries = sketch_shapes_to_grpc_geometries(
+                self._plane, self._edges, self._faces, only_one_curve=only_one_curve
+            )
+            cached = self._grpc_geometries_cache[only_one_curve] = (shapes, geometries)
+        return cached[1]
+
     def _single_point_context_reference(self) -> Point2D:
         """Get the last reference point from historical context.
 
@@ -90,33 +90,25 @@ class Slot(SketchFace):
 
         half_h = height_magnitude / 2
         half_box_w = (width_magnitude - height_magnitude) / 2
-        corner_1 = rotation @ [-half_box_w, half_h, 0]
-        corner_2 = rotation @ [-half_box_w, -half_h, 0]
-        corner_3 = rotation @ [half_box_w, -half_h, 0]
-        corner_4 = rotation @ [half_box_w, half_h, 0]
-        arc_1_center = rotation @ [-half_box_w, 0, 0]
-        arc_2_center = rotation @ [half_box_w, 0, 0]
-
-        self._slot_corner_1 = Point2D(
-            [center.x.m + corner_1[0], center.y.m + corner_1[1]], center.unit
-        )
-        self._slot_corner_2 = Point2D(
-            [center.x.m + corner_2[0], center.y.m + corner_2[1]], center.unit
-        )
-        self._slot_corner_3 = Point2D(
-            [center.x.m + corner_3[0], center.y.m + corner_3[1]], center.unit
-        )
-        self._slot_corner_4 = Point2D(
-            [center.x.m + corner_4[0], center.y.m + corner_4[1]], center.unit
-        )
-        self._arc_1_center = Point2D(
-            [center.x.m + arc_1_center[0], center.y.m + arc_1_center[1]],
-            center.unit,
-        )
-        self._arc_2_center = Point2D(
-            [center.x.m + arc_2_center[0], center.y.m + arc_2_center[1]],
-            center.unit,
-        )
+        points = np.array(
+            [
+                [-half_box_w, half_h, 0],
+                [-half_box_w, -half_h, 0],
+                [half_box_w, -half_h, 0],
+                [half_box_w, half_h, 0],
+                [-half_box_w, 0, 0],
+                [half_box_w, 0, 0],
+            ]
+        ) @ np.asarray(rotation)[:2].T + [center.x.m, center.y.m]
+
+        (
+            self._slot_corner_1,
+            self._slot_corner_2,
+            self._slot_corner_3,
+            self._slot_corner_4,
+            self._arc_1_center,
+            self._arc_2_center,
+        ) = (Point2D(point, center.unit) for point in points)
 
         # TODO: add plane to SketchSegment when available
         self._arc1 = Arc(self._slot_corner_1, self._slot_corner_2, self._arc_1_center)
@@ -147,14 +139,17 @@ class Slot(SketchFace):
     @property
     def perimeter(self) -> Quantity:
         """Perimeter of the slot."""
-        return np.pi * self._height.value + 2 * (self._width.value - self._height.value)
+        height = self._height.value
+        width = self._width.value.m_as(height.units)
+        return Quantity(np.pi * height.m + 2 * (width - height.m), height.units)
 
     @property
     def area(self) -> Quantity:
         """Area of the slot."""
-        return (
-            np.pi * (self._height.value / 2) ** 2
-            + (self._width.value - self._height.value) * self._height.value
+        height = self._height.value
+        width = self._width.value.m_as(height.units)
+        return Quantity(
+            np.pi * (height.m / 2) ** 2 + (width - height.m) * height.m, height.units**2
         )
 
     @property
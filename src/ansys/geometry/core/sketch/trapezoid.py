@@ -117,25 +117,22 @@ class Trapezoid(SketchFace):
 
         half_h = height_magnitude / 2
         half_w = width_magnitude / 2
-        rotated_point_1 = rotation @ [center.x.m - half_w, center.y.m - half_h, 0]
-        rotated_point_2 = rotation @ [center.x.m + half_w, center.y.m - half_h, 0]
-        rotated_point_3 = rotation @ [
-            center.x.m - half_w + height_magnitude / np.tan(slant_angle.value.m_as(UNITS.radian)),
-            center.y.m + half_h,
-            0,
-        ]
-        rotated_point_4 = rotation @ [
-            center.x.m
-            + half_w
-            - height_magnitude / np.tan(nonsymmetrical_slant_angle.value.m_as(UNITS.radian)),
-            center.y.m + half_h,
-            0,
-        ]
-
-        self._point1 = Point2D([rotated_point_1[0], rotated_point_1[1]], center.unit)
-        self._point2 = Point2D([rotated_point_2[0], rotated_point_2[1]], center.unit)
-        self._point3 = Point2D([rotated_point_3[0], rotated_point_3[1]], center.unit)
-        self._point4 = Point2D([rotated_point_4[0], rotated_point_4[1]], center.unit)
+        slant_offset = height_magnitude / np.tan(slant_angle.value.m_as(UNITS.radian))
+        nonsymmetrical_slant_offset = height_magnitude / np.tan(
+            nonsymmetrical_slant_angle.value.m_as(UNITS.radian)
+        )
+        rotated_points = np.array(
+            [
+                [center.x.m - half_w, center.y.m - half_h, 0],
+                [center.x.m + half_w, center.y.m - half_h, 0],
+                [center.x.m - half_w + slant_offset, center.y.m + half_h, 0],
+                [center.x.m + half_w - nonsymmetrical_slant_offset, center.y.m + half_h, 0],
+            ]
+        ) @ np.asarray(rotation)[:2].T
+
+        self._point1, self._point2, self._point3, self._point4 = (
+            Point2D(point, center.unit) for point in rotated_points
+        )
 
         # TODO: add plane to SketchSegment when available
         self._segment1 = SketchSegment(self._point1, self._point2)
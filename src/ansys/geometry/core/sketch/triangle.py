@@ -22,6 +22,8 @@
 """Provides for creating and managing a triangle."""
 
 from beartype import beartype as check_input_types
+import numpy as np
+from pint import Quantity
 import pyvista as pv
 
 from ansys.geometry.core.math.point import Point2D
@@ -43,6 +45,9 @@ class Triangle(SketchFace):
         Point that represents a triangle vertex.
     """
 
+    # Connectivity of the single triangular cell of the visualization polydata
+    _CELLS = np.array([3, 0, 1, 2])
+
     @check_input_types
     def __init__(self, point1: Point2D, point2: Point2D, point3: Point2D):
         """Initialize the triangle."""
@@ -85,27 +90,13 @@ class Triangle(SketchFace):
         pyvista.PolyData
             VTK pyvista.Polydata configuration.
         """
-        import numpy as np
-
-        return pv.Triangle(
-            np.array(
-                [
-                    [
-                        self.point1.x.m_as(DEFAULT_UNITS.LENGTH),
-                        self.point1.y.m_as(DEFAULT_UNITS.LENGTH),
-                        0,
-                    ],
-                    [
-                        self.point2.x.m_as(DEFAULT_UNITS.LENGTH),
-                        self.point2.y.m_as(DEFAULT_UNITS.LENGTH),
-                        0,
-                    ],
-                    [
-                        self.point3.x.m_as(DEFAULT_UNITS.LENGTH),
-                        self.point3.y.m_as(DEFAULT_UNITS.LENGTH),
-                        0,
-                    ],
-                ],
-                dtype=np.float64,
-            )
-        )
+        # Points store their coordinates in base units: convert all of them at once
+        vertices = Quantity(
+            np.array([self._point1, self._point2, self._point3]), self._point1.base_unit
+        ).m_as(DEFAULT_UNITS.LENGTH)
+        points = np.zeros((3, 3), dtype=np.float64)
+        points[:, :2] = vertices
+
+        # Built directly (deep copy keeps the shared connectivity untouched)
+        # instead of through ``pv.Triangle``, which re-validates every vertex
+        return pv.PolyData(points, self._CELLS, deep=True)
@@ -21,11 +21,15 @@
 # SOFTWARE.
 """"General testing fixtures."""
 import logging as deflogging  # Default logging
+from unittest.mock import MagicMock
 
+from ansys.api.geometry.v0.bodies_pb2_grpc import BodiesStub
+from ansys.api.geometry.v0.commands_pb2_grpc import CommandsStub
 import pytest
 
 # Define default pytest logging level to DEBUG and stdout
 from ansys.geometry.core import LOG
+from ansys.geometry.core.connection.client import GrpcClient
 
 LOG.setLevel(level="DEBUG")
 LOG.log_to_stdout()
@@ -118,3 +122,31 @@ def fake_record():
         return handler.format(record)
 
     return inner_fake_record
+
+
+@pytest.fixture
+def offline_client():
+    """Get a ``GrpcClient`` with mocked stubs that is not connected to any service."""
+    client = GrpcClient.__new__(GrpcClient)
+    client._closed = False
+    client._pending_requests = []
+    client._failed_requests = []
+    client._stubs = {BodiesStub: MagicMock(), CommandsStub: MagicMock()}
+    client._remote_instance = None
+    client._docker_instance = None
+    client._product_instance = None
+    client._channel = MagicMock()
+    client._log = LOG
+    return client
+
+
+@pytest.fixture
+def fake_future():
+    def inner_fake_future(done=True, error=None):
+        """Create a mocked gRPC future, failing with ``error`` if provided."""
+        future = MagicMock()
+        future.done.return_value = done
+        future.result.side_effect = error
+        return future
+
+    return inner_fake_future
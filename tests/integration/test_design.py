@@ -38,6 +38,7 @@ from ansys.geometry.core.designer import (
     SharedTopologyType,
     SurfaceType,
 )
+from ansys.geometry.core.designer.beam import BeamArray
 from ansys.geometry.core.designer.body import CollisionType
 from ansys.geometry.core.designer.face import FaceLoopType
 from ansys.geometry.core.errors import GeometryExitedError
@@ -48,6 +49,7 @@ from ansys.geometry.core.math import (
     UNITVECTOR3D_Y,
     UNITVECTOR3D_Z,
     Frame,
+    Matrix44,
     Plane,
     Point2D,
     Point3D,
@@ -971,7 +973,10 @@ def test_project_and_imprint_curves(modeler: Modeler):
     sketch = Sketch()
     sketch.box(Point2D([0, 0], UNITS.mm), Quantity(150, UNITS.mm), Quantity(150, UNITS.mm))
     body = comp.extrude_sketch(name="MyBox", sketch=sketch, distance=Quantity(50, UNITS.mm))
-    body_faces = body.faces
+    body_faces = comp.bodies[0].faces
+
+    # Faces are cached after their first retrieval, whichever body instance requests them
+    assert comp.bodies[0].faces[0] is body_faces[0]
 
     body_copy = body.copy(design, "copy")
 
@@ -1034,6 +1039,12 @@ def test_project_and_imprint_curves(modeler: Modeler):
     assert len(faces) == 2
     assert len(body_copy.faces) == 8
 
+    # Refreshing the body retrieves its faces again from the server
+    copy_faces = body_copy.faces
+    body_copy.refresh()
+    assert body_copy.faces[0] is not copy_faces[0]
+    assert body_copy.faces[0].id == copy_faces[0].id
+
 
 def test_copy_body(modeler: Modeler):
     """Test copying a body."""
@@ -1176,6 +1187,18 @@ def test_beams(modeler: Modeler):
     assert nested_component.beams[0] == beam_2
     assert nested_component.beams[1] == beam_3
 
+    # Check the bulk queries on the beams of the nested component
+    beam_array = BeamArray.from_beams(nested_component.beams)
+    assert len(beam_array) == 2
+    assert beam_array[1] == beam_3
+    assert beam_array.ids == [beam_2.id, beam_3.id]
+    assert np.allclose(beam_array.lengths(), np.linalg.norm([1, 11, 111]) / 1000)
+    assert np.allclose(beam_array.midpoints()[0], np.array([6.5, 71.5, 721.5]) / 1000)
+    translation = Matrix44([[1, 0, 0, 1], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]])
+    starts, ends = beam_array.transform(translation)
+    assert np.allclose(starts[0], np.array([1007, 77, 777]) / 1000)
+    assert np.allclose(ends[1], np.array([1007, 77, 777]) / 1000)
+
     # Once the beams are created, let's try deleting it.
     # For example, we shouldn't be able to delete beam_1 from the nested component.
     nested_component.delete_beam(beam_1)
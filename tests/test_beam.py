@@ -0,0 +1,84 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+
+from ansys.geometry.core.designer import Component
+from ansys.geometry.core.designer.beam import Beam, BeamArray, BeamCircularProfile
+from ansys.geometry.core.math import UNITVECTOR3D_X, UNITVECTOR3D_Y, Point3D
+from ansys.geometry.core.misc import UNITS, Distance
+
+
+def test_beam_endpoints(offline_client):
+    """Test that beams keep the given endpoints and expose them in bulk."""
+    component = Component("root", None, offline_client, preexisting_id="root")
+    profile = BeamCircularProfile(
+        "profile",
+        "circle",
+        Distance(1, UNITS.mm),
+        Point3D([0, 0, 0]),
+        UNITVECTOR3D_X,
+        UNITVECTOR3D_Y,
+    )
+    start, end = Point3D([0, 0, 0], UNITS.mm), Point3D([30, 40, 0], UNITS.mm)
+    beam = Beam("beam", start, end, profile, component)
+
+    assert beam.start is start
+    assert beam.end is end
+    assert beam.start.unit == UNITS.mm
+
+    beams = BeamArray([beam])
+    assert np.allclose(beams.lengths(), [0.05])
+
+
+def test_circular_profile_describe_follows_changes():
+    """Test that the profile description reflects changes to its radius and center."""
+    radius, center = Distance(1, UNITS.mm), Point3D([0, 0, 0])
+    profile = BeamCircularProfile(
+        "profile", "circle", radius, center, UNITVECTOR3D_X, UNITVECTOR3D_Y
+    )
+    assert "Radius               : 1.0 millimeter" in str(profile)
+
+    radius.value = 2 * UNITS.mm
+    center.x = 5 * UNITS.m
+    description = profile.describe()
+    assert "Radius               : 2.0 millimeter" in description
+    assert "Center               : [5.0,0.0,0.0] in meters" in description
+
+
+def test_beam_follows_endpoint_changes(offline_client):
+    """Test that beam summaries use the current coordinates of its endpoints."""
+    component = Component("root", None, offline_client, preexisting_id="root")
+    profile = BeamCircularProfile(
+        "profile",
+        "circle",
+        Distance(1, UNITS.mm),
+        Point3D([0, 0, 0]),
+        UNITVECTOR3D_X,
+        UNITVECTOR3D_Y,
+    )
+    start, end = Point3D([0, 0, 0]), Point3D([3, 4, 0])
+    beam = Beam("beam", start, end, profile, component)
+
+    start.x = 6 * UNITS.m
+    assert "Start                : [6.0,0.0,0.0] in meters" in beam.describe()
+    assert np.allclose(BeamArray([beam]).lengths(), [5])
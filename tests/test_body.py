@@ -0,0 +1,246 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+from ansys.api.geometry.v0.bodies_pb2 import GetFacesResponse
+from ansys.api.geometry.v0.bodies_pb2_grpc import BodiesStub
+from ansys.api.geometry.v0.commands_pb2_grpc import CommandsStub
+from ansys.api.geometry.v0.models_pb2 import Face as GRPCFace, Tessellation
+import numpy as np
+from pint import Quantity
+import pytest
+import pyvista as pv
+from scipy.spatial.transform import Rotation as SpatialRotation
+
+import ansys.geometry.core as pyansys_geometry
+from ansys.geometry.core.connection.conversions import tess_to_pd
+from ansys.geometry.core.designer import Component, MidSurfaceOffsetType
+from ansys.geometry.core.designer.body import MasterBody
+from ansys.geometry.core.math import IDENTITY_MATRIX44, Matrix44
+from ansys.geometry.core.misc import UNITS
+
+
+def test_midsurface_assignments_rollback(offline_client, fake_future):
+    """Test that failed mid-surface assignments restore the previous values."""
+    body = MasterBody("1", "surface", offline_client, is_surface=True)
+    commands_stub = offline_client._get_stub(CommandsStub)
+
+    thickness = Quantity(2, UNITS.mm)
+    commands_stub.AssignMidSurfaceThickness.future.return_value = fake_future()
+    body.add_midsurface_thickness(thickness)
+    commands_stub.AssignMidSurfaceOffsetType.future.return_value = fake_future()
+    body.add_midsurface_offset(MidSurfaceOffsetType.TOP)
+    offline_client.flush()
+    assert body.surface_thickness == thickness
+    assert body.surface_offset == MidSurfaceOffsetType.TOP
+
+    commands_stub.AssignMidSurfaceThickness.future.return_value = fake_future(
+        done=False, error=ValueError("thickness")
+    )
+    body.add_midsurface_thickness(Quantity(5, UNITS.mm))
+    commands_stub.AssignMidSurfaceOffsetType.future.return_value = fake_future(
+        done=False, error=ValueError("offset")
+    )
+    body.add_midsurface_offset(MidSurfaceOffsetType.BOTTOM)
+    assert body.surface_thickness == Quantity(5, UNITS.mm)
+    assert body.surface_offset == MidSurfaceOffsetType.BOTTOM
+
+    with pytest.raises(ValueError, match="thickness"):
+        offline_client.flush()
+    assert body.surface_thickness == thickness
+    assert body.surface_offset == MidSurfaceOffsetType.TOP
+
+
+@pytest.fixture
+def offline_component(offline_client, monkeypatch):
+    """Get a component holding three bodies, with mocked body deletions."""
+    monkeypatch.setattr(pyansys_geometry, "DISABLE_MULTIPLE_DESIGN_CHECK", True)
+    component = Component("root", None, offline_client, preexisting_id="root")
+    component._bodies_stub = MagicMock()
+    component._master_component.part.bodies.extend(
+        MasterBody(f"body{i}", f"body{i}", offline_client) for i in range(3)
+    )
+    return component
+
+
+def test_boolean_deletes_tool_bodies(offline_component):
+    """Test that Boolean operations delete their tool bodies synchronously by default."""
+    target, *tools = offline_component.bodies
+    target.subtract(tools)
+
+    delete = offline_component._bodies_stub.Delete
+    assert [call.args[0].id for call in delete.call_args_list] == ["body1", "body2"]
+    delete.future.assert_not_called()
+    assert [body.id for body in offline_component.bodies] == ["body0"]
+
+
+def test_batch_deletions(offline_component, fake_future):
+    """Test that deletions inside a batch are deferred until it ends."""
+    delete = offline_component._bodies_stub.Delete
+    delete.future.return_value = fake_future(done=False)
+
+    target, *tools = offline_component.bodies
+    with offline_component.batch_deletions():
+        with offline_component.batch_deletions():
+            target.subtract(tools)
+        # Tool bodies are dead on the client side, but not deleted on the server yet
+        assert [body.id for body in offline_component.bodies] == ["body0"]
+        delete.future.assert_not_called()
+
+    delete.assert_not_called()
+    assert [call.args[0].id for call in delete.future.call_args_list] == ["body1", "body2"]
+    assert delete.future.return_value.result.call_count == 2
+    assert [body.id for body in offline_component.bodies] == ["body0"]
+
+
+def test_batch_deletions_failure(offline_component, fake_future):
+    """Test that bodies whose batched deletion fails are alive again."""
+    delete = offline_component._bodies_stub.Delete
+    delete.future.side_effect = [
+        fake_future(error=ValueError("not deleted")),
+        fake_future(),
+    ]
+
+    body0, body1, body2 = offline_component.bodies
+    with pytest.raises(ValueError, match="not deleted"):
+        with offline_component.batch_deletions():
+            offline_component.delete_body(body1)
+            offline_component.delete_body(body2)
+
+    assert [body.id for body in offline_component.bodies] == ["body0", "body1"]
+
+
+def test_body_midsurface_properties(offline_component):
+    """Test that body mid-surface properties follow the template's surface check."""
+    body = offline_component.bodies[0]
+    body._surface_thickness = Quantity(2, UNITS.mm)
+    body._surface_offset = MidSurfaceOffsetType.TOP
+    assert body.surface_thickness is None
+    assert body.surface_offset is None
+
+    body._template._is_surface = True
+    assert body.surface_thickness == Quantity(2, UNITS.mm)
+    assert body.surface_offset == MidSurfaceOffsetType.TOP
+
+
+def test_body_faces_cached_by_id(offline_component):
+    """Test that faces are cached once per body, whichever instance requests them."""
+    get_faces = offline_component.bodies[0]._template._bodies_stub.GetFaces
+    get_faces.return_value = GetFacesResponse(
+        faces=[GRPCFace(id=f"face{i}", surface_type=1) for i in range(2)]
+    )
+
+    faces = offline_component.bodies[0].faces
+    for _ in range(5):
+        assert offline_component.bodies[0].faces == faces
+    assert offline_component.bodies[0]._face_ids == {"face0", "face1"}
+    assert offline_component.bodies[0]._face_ids == {"face0", "face1"}
+    get_faces.assert_called_once()
+    assert len(offline_component.bodies[0]._template._topology_cache) == 2
+
+
+@pytest.fixture
+def tessellated_body(offline_client):
+    """Get a master body whose tessellation is made of a triangle and a quad."""
+    tessellation = [
+        Tessellation(vertices=[0, 0, 0, 1, 0, 0, 0, 1, 0], faces=[3, 0, 1, 2]),
+        Tessellation(
+            vertices=[0, 0, 1, 1, 0, 1, 1, 1, 1, 0, 1, 1], faces=[3, 0, 1, 2, 3, 0, 2, 3]
+        ),
+    ]
+    bodies_stub = offline_client._get_stub(BodiesStub)
+    bodies_stub.GetTessellation.return_value.face_tessellation.values.return_value = (
+        tessellation
+    )
+    return MasterBody("1", "body", offline_client), tessellation
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [
+        IDENTITY_MATRIX44,
+        Matrix44(
+            [
+                [*row, offset]
+                for row, offset in zip(
+                    SpatialRotation.from_euler("xyz", [30, 45, 60], degrees=True).as_matrix(),
+                    [1, -2, 3],
+                )
+            ]
+            + [[0, 0, 0, 1]]
+        ),
+    ],
+)
+def test_tessellate(tessellated_body, transform):
+    """Test that tessellating matches transforming and combining the faces one by one."""
+    body, tessellation = tessellated_body
+    expected_blocks = pv.MultiBlock(
+        [tess_to_pd(tess).transform(transform) for tess in tessellation]
+    )
+    ugrid = expected_blocks.combine()
+    expected_merged = pv.PolyData(ugrid.points, ugrid.cells, n_faces=ugrid.n_cells)
+
+    # Repeated calls are served from the cache
+    for _ in range(2):
+        blocks = body.tessellate(transform=transform)
+        assert blocks.n_blocks == expected_blocks.n_blocks
+        for block, expected in zip(blocks, expected_blocks):
+            assert np.allclose(block.points, expected.points)
+            assert np.array_equal(block.faces, expected.faces)
+
+        merged = body.tessellate(merge=True, transform=transform)
+        assert np.allclose(merged.points, expected_merged.points)
+        assert np.array_equal(merged.faces, expected_merged.faces)
+        assert merged.n_cells == expected_merged.n_cells
+
+    body._bodies_stub.GetTessellation.assert_called_once()
+
+
+def test_tessellate_results_do_not_share_cache(tessellated_body):
+    """Test that modifying a returned tessellation does not alter later results."""
+    body, _ = tessellated_body
+    blocks = body.tessellate()
+    merged = body.tessellate(merge=True)
+    expected_points = merged.points.copy()
+
+    blocks[0].points[:] = 100
+    merged.points[:] = 100
+
+    assert np.array_equal(body.tessellate(merge=True).points, expected_points)
+    assert np.array_equal(body.tessellate()[0].points, expected_points[:3])
+
+
+def test_tessellate_caches_latest_transform(tessellated_body):
+    """Test that only the meshes for the latest requested transform are cached."""
+    body, tessellation = tessellated_body
+    translation = Matrix44([[1, 0, 0, 1], [0, 1, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]])
+    for transform in (IDENTITY_MATRIX44, translation, IDENTITY_MATRIX44):
+        blocks = body.tessellate(transform=transform)
+        expected = tess_to_pd(tessellation[0]).transform(transform)
+        assert np.allclose(blocks[0].points, expected.points)
+        merged = body.tessellate(merge=True, transform=transform)
+        assert np.allclose(merged.points[:3], expected.points)
+        assert body._tessellation_pdata[0] == transform.tobytes()
+        assert body._tessellation_merged[0] == transform.tobytes()
+
+    body._bodies_stub.GetTessellation.assert_called_once()
@@ -0,0 +1,57 @@
+# Copyright (C) 2023 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+import ansys.geometry.core as pyansys_geometry
+from ansys.geometry.core.designer import Component
+from ansys.geometry.core.designer.part import MasterComponent
+from ansys.geometry.core.math import IDENTITY_MATRIX44, Matrix44
+
+
+@pytest.fixture
+def offline_components(offline_client, monkeypatch):
+    """Get a root component and a nested child component."""
+    monkeypatch.setattr(pyansys_geometry, "DISABLE_MULTIPLE_DESIGN_CHECK", True)
+    root = Component("root", None, offline_client, preexisting_id="root")
+    child = Component("child", root, offline_client, preexisting_id="child")
+    return root, child
+
+
+def test_world_transform_follows_master_transform(offline_components):
+    """Test that changing a master component transform refreshes the world transforms."""
+    _, child = offline_components
+    assert np.array_equal(child.get_world_transform(), IDENTITY_MATRIX44)
+
+    version = MasterComponent._transform_version
+    translation = Matrix44([[1, 0, 0, 1], [0, 1, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]])
+    child._master_component.transform = translation
+    assert MasterComponent._transform_version == version + 1
+    assert np.array_equal(child.get_world_transform(), translation)
+
+
+def test_world_transform_returns_copy(offline_components):
+    """Test that modifying a returned world transform does not alter the cached one."""
+    _, child = offline_components
+    child.get_world_transform()[:3, 3] = 5
+    assert np.array_equal(child.get_world_transform(), IDENTITY_MATRIX44)
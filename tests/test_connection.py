@@ -20,12 +20,15 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from unittest.mock import MagicMock
+
 from beartype.roar import BeartypeCallHintParamViolation
 import grpc
 import numpy as np
 from pint import Quantity
 import pytest
 
+import ansys.geometry.core as pyansys_geometry
 from ansys.geometry.core.connection.client import GrpcClient, wait_until_healthy
 from ansys.geometry.core.connection.conversions import (
     frame_to_grpc_frame,
@@ -39,6 +42,7 @@ from ansys.geometry.core.connection.conversions import (
     sketch_segment_to_grpc_line,
     unit_vector_to_grpc_direction,
 )
+from ansys.geometry.core.designer import Design
 from ansys.geometry.core.math import Frame, Plane, Point2D, Point3D, UnitVector3D
 from ansys.geometry.core.misc import UNITS, Angle
 from ansys.geometry.core.sketch import Arc, Polygon, SketchCircle, SketchEllipse, SketchSegment
@@ -313,3 +317,64 @@ def test_frame_message_conversion():
     assert grpc_frame_message.dir_y.x == pytest.approx(0.7071067811865475, rel=1e-7, abs=1e-8)
     assert grpc_frame_message.dir_y.y == pytest.approx(-0.7071067811865475, rel=1e-7, abs=1e-8)
     assert grpc_frame_message.dir_y.z == 0.0
+
+
+def test_flush_checks_every_pending_request(offline_client, fake_future):
+    """Test that flushing waits for every pending request and raises the first error."""
+    first_error, second_error = ValueError("first"), ValueError("second")
+    futures = [
+        fake_future(done=False, error=first_error),
+        fake_future(done=False),
+        fake_future(done=False, error=second_error),
+    ]
+    for future in futures:
+        offline_client._add_pending_request(future)
+
+    with pytest.raises(ValueError, match="first"):
+        offline_client.flush()
+    for future in futures:
+        future.result.assert_called_once()
+    assert offline_client._pending_requests == []
+
+    # Errors are only reported once
+    offline_client.flush()
+
+
+def test_pending_requests_drop_completed(offline_client, fake_future):
+    """Test that completed requests are checked and dropped when new ones are added."""
+    rollback = MagicMock()
+    offline_client._add_pending_request(fake_future(error=ValueError("failed")), rollback)
+    offline_client._add_pending_request(fake_future())
+    offline_client._add_pending_request(fake_future(done=False))
+
+    assert len(offline_client._pending_requests) == 1
+    rollback.assert_called_once()
+    with pytest.raises(ValueError, match="failed"):
+        offline_client.flush()
+
+
+def test_close_flushes_pending_requests(offline_client, fake_future):
+    """Test that closing the client waits for the pending requests."""
+    future = fake_future(done=False)
+    offline_client._add_pending_request(future)
+    offline_client.close()
+
+    future.result.assert_called_once()
+    offline_client._channel.close.assert_called_once()
+    assert offline_client._pending_requests == []
+
+
+def test_save_raises_failed_pending_request(offline_client, fake_future, monkeypatch):
+    """Test that a failed pending request is raised before saving the design."""
+    monkeypatch.setattr(pyansys_geometry, "DISABLE_MULTIPLE_DESIGN_CHECK", True)
+    design = Design.__new__(Design)
+    design._grpc_client = offline_client
+    design._design_stub = MagicMock()
+
+    offline_client._add_pending_request(fake_future(error=ValueError("not assigned")))
+    with pytest.raises(ValueError, match="not assigned"):
+        design.save("design.scdocx")
+    design._design_stub.SaveAs.assert_not_called()
+
+    design.save("design.scdocx")
+    design._design_stub.SaveAs.assert_called_once()
@@ -81,6 +81,37 @@ def test_interval():
     assert closed_interval.get_span() == 2
 
 
+def test_interval_unite_intersect():
+    first = Interval(0, 2)
+    second = Interval(1, 3)
+
+    union = Interval.unite(first, second)
+    assert union.start == 0
+    assert union.end == 3
+
+    intersection = Interval.intersect(first, second, 1e-8)
+    assert intersection.start == 1
+    assert intersection.end == 2
+
+    first.self_unite(second)
+    assert first.start == 0
+    assert first.end == 3
+
+    first.self_intersect(Interval(2, 5), 1e-8)
+    assert first.start == 2
+    assert first.end == 3
+
+    # Disjoint intervals do not intersect
+    assert Interval.intersect(Interval(0, 1), Interval(2, 3), 1e-8) is None
+    disjoint = Interval(0, 1)
+    disjoint.self_intersect(Interval(2, 3), 1e-8)
+    assert disjoint.is_empty()
+
+    # Intervals touching within the tolerance intersect in a single value
+    touching = Interval.intersect(Interval(0, 1), Interval(1 + 1e-10, 2), 1e-8)
+    assert touching.start == touching.end == 1 + 1e-10
+
+
 def test_param_form():
     open = ParamForm.OPEN
     closed = ParamForm.CLOSED
@@ -725,6 +725,22 @@ def test_circle():
     assert np.allclose(circle_mirror._axis, UnitVector3D([0, -0.9543083, 0.29882381]))
 
 
+def test_circle_measurements_follow_radius():
+    """Test that ``Circle`` perimeter and area follow changes of its radius."""
+    radius = Distance(1, UNITS.m)
+    circle = Circle(Point3D([0, 0, 0]), radius)
+    assert circle.perimeter == 2 * np.pi * UNITS.m
+    assert circle.area == np.pi * UNITS.m**2
+
+    radius.value = 2 * UNITS.m
+    assert circle.perimeter == 4 * np.pi * UNITS.m
+    assert circle.area == 4 * np.pi * UNITS.m**2
+
+    radius.unit = UNITS.cm
+    assert circle.perimeter == 400 * np.pi * UNITS.cm
+    assert circle.area == 40000 * np.pi * UNITS.cm**2
+
+
 def test_circle_evaluation():
     """``CircleEvaluation`` construction and equivalency."""
     origin = Point3D([0, 0, 0])
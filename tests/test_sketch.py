@@ -20,10 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import math
+
 from beartype.roar import BeartypeCallHintParamViolation
 import numpy as np
 from pint import Quantity
 import pytest
+import pyvista as pv
 
 from ansys.geometry.core.math import (
     ZERO_POINT2D,
@@ -49,66 +52,80 @@ from ansys.geometry.core.sketch import (
 DOUBLE_EPS = np.finfo(float).eps
 
 
-def test_errors_sketch_segment():
+@pytest.mark.parametrize(
+    "start,end,error,match",
+    [
+        ("a", "b", BeartypeCallHintParamViolation, None),
+        (Point2D([10, 20], unit=UNITS.meter), "b", BeartypeCallHintParamViolation, None),
+        (
+            Point2D(),
+            Point2D(),
+            ValueError,
+            "The numpy.ndarray 'start' should not be a nan numpy.ndarray.",
+        ),
+        (
+            Point2D([10, 20]),
+            Point2D(),
+            ValueError,
+            "The numpy.ndarray 'end' should not be a nan numpy.ndarray.",
+        ),
+        (
+            Point2D([10, 20]),
+            Point2D([10, 20]),
+            ValueError,
+            "Parameters 'start' and 'end' have the same values. No segment can be created.",
+        ),
+    ],
+)
+def test_errors_sketch_segment(start, end, error, match):
     """Check errors when handling a ``SketchSegment``."""
-    with pytest.raises(BeartypeCallHintParamViolation):
-        SketchSegment("a", "b")
-    with pytest.raises(BeartypeCallHintParamViolation):
-        SketchSegment(Point2D([10, 20], unit=UNITS.meter), "b")
-    with pytest.raises(
-        ValueError, match="The numpy.ndarray 'start' should not be a nan numpy.ndarray."
-    ):
-        SketchSegment(Point2D(), Point2D())
-    with pytest.raises(
-        ValueError, match="The numpy.ndarray 'end' should not be a nan numpy.ndarray."
-    ):
-        SketchSegment(Point2D([10, 20]), Point2D())
-    with pytest.raises(
-        ValueError,
-        match="Parameters 'start' and 'end' have the same values. No segment can be created.",
-    ):
-        SketchSegment(Point2D([10, 20]), Point2D([10, 20]))
+    with pytest.raises(error, match=match):
+        SketchSegment(start, end)
 
 
 def test_sketch_segment_edge():
     """Test SketchSegment SketchEdge sketching."""
     # Create a Sketch instance
     sketch = Sketch()
+    p_2_3 = Point2D([2, 3])
+    p_3_3 = Point2D([3, 3])
+    p_3_2 = Point2D([3, 2])
+    p_2_0 = Point2D([2, 0])
+    p_1_1 = Point2D([1, 1])
+    p_0_0 = Point2D([0, 0])
 
     # sketch api has 0, 0 origin as default start position
     assert len(sketch.edges) == 0
-    sketch.segment_to_point(Point2D([2, 3]), "Segment1")
+    sketch.segment_to_point(p_2_3, "Segment1")
     assert len(sketch.edges) == 1
     assert sketch.edges[0].start == ZERO_POINT2D
-    assert sketch.edges[0].end == Point2D([2, 3])
+    assert sketch.edges[0].end == p_2_3
     assert sketch.edges[0].length.m == pytest.approx(3.60555128, rel=1e-7, abs=1e-8)
 
     # sketch api keeps last edge endpoint as context for new edge
-    sketch.segment_to_point(Point2D([3, 3]), "Segment2").segment_to_point(
-        Point2D([3, 2]), "Segment3"
-    )
+    sketch.segment_to_point(p_3_3, "Segment2").segment_to_point(p_3_2, "Segment3")
     assert len(sketch.edges) == 3
-    assert sketch.edges[1].start == Point2D([2, 3])
-    assert sketch.edges[1].end == Point2D([3, 3])
-    assert sketch.edges[2].start == Point2D([3, 3])
-    assert sketch.edges[2].end == Point2D([3, 2])
+    assert sketch.edges[1].start == p_2_3
+    assert sketch.edges[1].end == p_3_3
+    assert sketch.edges[2].start == p_3_3
+    assert sketch.edges[2].end == p_3_2
 
     # sketch api allows segment defined by two points
-    sketch.segment(Point2D([3, 2]), Point2D([2, 0]), "Segment4")
+    sketch.segment(p_3_2, p_2_0, "Segment4")
     assert len(sketch.edges) == 4
-    assert sketch.edges[3].start == Point2D([3, 2])
-    assert sketch.edges[3].end == Point2D([2, 0])
+    assert sketch.edges[3].start == p_3_2
+    assert sketch.edges[3].end == p_2_0
 
     # sketch api allows segment defined by vector magnitude
-    sketch.segment_from_point_and_vector(Point2D([2, 0]), Vector2D([-1, 1]), "Segment5")
+    sketch.segment_from_point_and_vector(p_2_0, Vector2D([-1, 1]), "Segment5")
     assert len(sketch.edges) == 5
-    assert sketch.edges[4].start == Point2D([2, 0])
-    assert sketch.edges[4].end == Point2D([1, 1])
+    assert sketch.edges[4].start == p_2_0
+    assert sketch.edges[4].end == p_1_1
 
     sketch.segment_from_vector(Vector2D([-1, -1]), "Segment6")
     assert len(sketch.edges) == 6
-    assert sketch.edges[5].start == Point2D([1, 1])
-    assert sketch.edges[5].end == Point2D([0, 0])
+    assert sketch.edges[5].start == p_1_1
+    assert sketch.edges[5].end == p_0_0
 
     segment1_retrieved = sketch.get("Segment1")
     assert len(segment1_retrieved) == 1
@@ -138,13 +155,19 @@ def test_sketch_segment_edge():
         ValueError,
         match="Parameters 'start' and 'end' have the same values. No segment can be created.",
     ):
-        sketch.segment(Point2D([3, 2]), Point2D([3, 2]), "Segment4")
+        sketch.segment(p_3_2, p_3_2, "Segment4")
 
 
 def test_sketch_arc_edge():
     """Test Arc SketchEdge sketching."""
     # Create a Sketch instance
     sketch = Sketch()
+    p_3_3 = Point2D([3, 3])
+    p_3_0 = Point2D([3, 0])
+    p_0_0 = Point2D([0, 0])
+    p_10_10 = Point2D([10, 10])
+    p_10_m10 = Point2D([10, -10])
+    p_10_0 = Point2D([10, 0])
 
     # fluent API has (0, 0) origin as default start position
     #
@@ -164,10 +187,10 @@ def test_sketch_arc_edge():
     # angle starting on S and ending on E. This is also PI * 3 / 2 in rads
     #
     assert len(sketch.edges) == 0
-    sketch.arc_to_point(Point2D([3, 3]), Point2D([3, 0]), False, "Arc1")
+    sketch.arc_to_point(p_3_3, p_3_0, False, "Arc1")
     assert len(sketch.edges) == 1
     assert sketch.edges[0].start == ZERO_POINT2D
-    assert sketch.edges[0].end == Point2D([3, 3])
+    assert sketch.edges[0].end == p_3_3
     assert sketch.edges[0].angle == np.pi * 3 / 2
 
     # Fluent api keeps last edge endpoint as context for new edge
@@ -176,16 +199,16 @@ def test_sketch_arc_edge():
     # In this case, following the previous drawing, we are going from E to S with center
     # at 'O' again, but in clockwise direction. This will lead to 270 degs (PI * 3 / 2 in rads).
     #
-    sketch.arc_to_point(Point2D([0, 0]), Point2D([3, 0]), clockwise=True, tag="Arc2")
+    sketch.arc_to_point(p_0_0, p_3_0, clockwise=True, tag="Arc2")
     assert len(sketch.edges) == 2
-    assert sketch.edges[1].start == Point2D([3, 3])
-    assert sketch.edges[1].end == Point2D([0, 0])
+    assert sketch.edges[1].start == p_3_3
+    assert sketch.edges[1].end == p_0_0
     assert sketch.edges[1].angle == np.pi * 3 / 2
 
-    sketch.arc(Point2D([10, 10]), Point2D([10, -10]), Point2D([10, 0]), tag="Arc3")
+    sketch.arc(p_10_10, p_10_m10, p_10_0, tag="Arc3")
     assert len(sketch.edges) == 3
-    assert sketch.edges[2].start == Point2D([10, 10])
-    assert sketch.edges[2].end == Point2D([10, -10])
+    assert sketch.edges[2].start == p_10_10
+    assert sketch.edges[2].end == p_10_m10
     assert sketch.edges[2].angle == np.pi
     assert sketch.edges[2].sector_area.m == pytest.approx(157.07963267948966, rel=1e-7, abs=1e-8)
     assert sketch.edges[2].length.m == pytest.approx(31.41592653589793, rel=1e-7, abs=1e-8)
@@ -208,19 +231,25 @@ def test_sketch_triangle_face():
     """Test Triangle SketchFace sketching."""
     # Create a Sketch instance
     sketch = Sketch()
+    p_10_10 = Point2D([10, 10])
+    p_2_1 = Point2D([2, 1])
+    p_10_m10 = Point2D([10, -10])
+    p_m10_10 = Point2D([-10, 10])
+    p_5_6 = Point2D([5, 6])
+    p_m10_m10 = Point2D([-10, -10])
 
     # Create the sketch face with triangle
-    sketch.triangle(Point2D([10, 10]), Point2D([2, 1]), Point2D([10, -10]), tag="triangle1")
+    sketch.triangle(p_10_10, p_2_1, p_10_m10, tag="triangle1")
     assert len(sketch.faces) == 1
-    assert sketch.faces[0].point1 == Point2D([10, 10])
-    assert sketch.faces[0].point2 == Point2D([2, 1])
-    assert sketch.faces[0].point3 == Point2D([10, -10])
+    assert sketch.faces[0].point1 == p_10_10
+    assert sketch.faces[0].point2 == p_2_1
+    assert sketch.faces[0].point3 == p_10_m10
 
-    sketch.triangle(Point2D([-10, 10]), Point2D([5, 6]), Point2D([-10, -10]), tag="triangle2")
+    sketch.triangle(p_m10_10, p_5_6, p_m10_m10, tag="triangle2")
     assert len(sketch.faces) == 2
-    assert sketch.faces[1].point1 == Point2D([-10, 10])
-    assert sketch.faces[1].point2 == Point2D([5, 6])
-    assert sketch.faces[1].point3 == Point2D([-10, -10])
+    assert sketch.faces[1].point1 == p_m10_10
+    assert sketch.faces[1].point2 == p_5_6
+    assert sketch.faces[1].point3 == p_m10_m10
 
     triangle1_retrieved = sketch.get("triangle1")
     assert len(triangle1_retrieved) == 1
@@ -283,6 +312,12 @@ def test_sketch_circle_instance():
     assert circle.area == np.pi * radius**2
     assert circle.perimeter == 2 * np.pi * radius
 
+    # Check the visualization matches a translated PyVista circle
+    pd = SketchCircle(Point2D([3, 4]), 2 * DEFAULT_UNITS.LENGTH).visualization_polydata
+    expected = pv.Circle(2).translate([3, 4, 0])
+    assert np.allclose(pd.points, expected.points)
+    assert np.array_equal(pd.faces, expected.faces)
+
     # Test circle on different plane
     center, radius = (
         Point2D([1, 1], DEFAULT_UNITS.LENGTH),
@@ -300,15 +335,21 @@ def test_sketch_circle_instance():
     assert circle.perimeter == 2 * np.pi * radius
 
 
-def test_sketch_circle_instance_errors():
+@pytest.mark.parametrize(
+    "radius,error,match",
+    [
+        (
+            1 * UNITS.fahrenheit,
+            TypeError,
+            r"The pint.Unit provided as an input should be a \[length\] quantity.",
+        ),
+        (-10 * UNITS.mm, ValueError, "Radius must be a real positive value."),
+    ],
+)
+def test_sketch_circle_instance_errors(radius, error, match):
     """Test various circle instantiation errors."""
-    with pytest.raises(
-        TypeError, match=r"The pint.Unit provided as an input should be a \[length\] quantity."
-    ):
-        SketchCircle(Point2D([10, 20]), 1 * UNITS.fahrenheit)
-
-    with pytest.raises(ValueError, match="Radius must be a real positive value."):
-        SketchCircle(Point2D([10, 20]), -10 * UNITS.mm)
+    with pytest.raises(error, match=match):
+        SketchCircle(Point2D([10, 20]), radius)
 
 
 def test_sketch_circle_face():
@@ -341,13 +382,13 @@ def test_sketch_circle_face():
 def test_ellipse_instance():
     """Test ellipse instance."""
     semi_major, semi_minor, origin = 2 * UNITS.m, 1 * UNITS.m, Point2D([0, 0], UNITS.m)
-    ecc = np.sqrt(1 - (semi_minor / semi_major) ** 2)
+    ecc = math.sqrt(1 - (semi_minor.m_as(UNITS.m) / semi_major.m_as(UNITS.m)) ** 2)
     ellipse = SketchEllipse(origin, semi_major, semi_minor)
 
     # Check attributes are expected ones
     assert ellipse.major_radius == semi_major
     assert ellipse.minor_radius == semi_minor
-    assert abs(ellipse.eccentricity - ecc.m) <= DOUBLE_EPS
+    assert abs(ellipse.eccentricity - ecc) <= DOUBLE_EPS
     assert ellipse.linear_eccentricity == np.sqrt(semi_major**2 - semi_minor**2)
     assert ellipse.semi_latus_rectum == semi_minor**2 / semi_major
     assert abs((ellipse.perimeter - 9.6884482205477 * UNITS.m).m) <= 5e-14
@@ -407,14 +448,14 @@ def test_sketch_ellipse_face():
 
     # Draw a circle in previous sketch
     semi_major, semi_minor, origin = 2 * UNITS.m, 1 * UNITS.m, Point2D([0, 0], UNITS.m)
-    ecc = np.sqrt(1 - (semi_minor / semi_major) ** 2)
+    ecc = math.sqrt(1 - (semi_minor.m_as(UNITS.m) / semi_major.m_as(UNITS.m)) ** 2)
     sketch.ellipse(origin, semi_major, semi_minor, tag="Ellipse")
 
     # Check attributes are expected ones
     assert len(sketch.faces) == 1
     assert sketch.faces[0].major_radius == semi_major
     assert sketch.faces[0].minor_radius == semi_minor
-    assert abs(sketch.faces[0].eccentricity - ecc.m) <= DOUBLE_EPS
+    assert abs(sketch.faces[0].eccentricity - ecc) <= DOUBLE_EPS
     assert sketch.faces[0].linear_eccentricity == np.sqrt(semi_major**2 - semi_minor**2)
     assert sketch.faces[0].semi_latus_rectum == semi_minor**2 / semi_major
     assert abs((sketch.faces[0].perimeter - 9.6884482205477 * UNITS.m).m) <= 5e-14
@@ -1054,3 +1095,21 @@ def test_start_center_and_angle_clockwise_from_sketch():
 
     # Verify the final point of the arc assuming a clockwise arc
     assert np.allclose(arc.end, end)
+
+
+def test_sketch_grpc_geometries_cache():
+    """Test that the cached gRPC geometries follow changes made through the sketch."""
+    sketch = Sketch()
+    sketch.circle(Point2D([0, 0]), Quantity(1, UNITS.m))
+    geometries = sketch._as_grpc_geometries()
+    assert sketch._as_grpc_geometries() is geometries
+
+    sketch.translate_sketch_plane_by_offset(z=Quantity(2, UNITS.m))
+    assert sketch._as_grpc_geometries().circles[0].center.z == 2
+
+    sketch.circle(Point2D([5, 0]), Quantity(1, UNITS.m))
+    assert len(sketch._as_grpc_geometries().circles) == 2
+
+    # Shapes appended to the public lists are detected as well
+    sketch.edges.append(SketchSegment(Point2D([0, 0]), Point2D([1, 0])))
+    assert len(sketch._as_grpc_geometries().lines) == 1